@@ -0,0 +1,7 @@
+"""
+Быстрые алгоритмы для циклических кодов (к indiv3.py).
+
+Полиномы -- целочисленные массивы NumPy, коэффициенты от младшей степени к старшей.
+Поле коэффициентов -- GF(q) для простого q или q = p^m (таблицы log/antilog, см. gf).
+"""
+from .factorization import cyclotomic_cosets, cyclotomic_factorization, factor_xn_minus_1
@@ -0,0 +1,201 @@
+"""
+Каталог циклических кодов длины N над GF(p) с дисковым кэшем.
+
+Каталог -- чистая функция (N, p): множители x^N - 1, g, h, k, d,
+номера двойственных/возвратных кодов и, по запросу, матрицы выбранных кодов.
+Он сохраняется в .npz с версией формата; при повторном запуске массивы
+читаются из файла по мере обращения, sympy не импортируется.
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from . import poly
+from .distance import minimum_distances
+from .enumeration import enumerate_codes, mask_indices
+from .factorization import factor_xn_minus_1
+from .matrices import generator_matrix, parity_matrix, systematic_matrices
+from .relations import reciprocal_permutation, relations
+
+CACHE_VERSION = 1
+CACHE_DIR = os.environ.get(
+    "CYCLIC_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cyclic_cache"),
+)
+MATRICES = ("G", "H", "G_sys", "H_sys")
+
+
+def _coeff_dtype(p):
+    return np.uint8 if p < 256 else np.int64
+
+
+def _padded(polys, n, p):
+    out = np.zeros((len(polys), n + 1), dtype=_coeff_dtype(p))
+    for i, a in enumerate(polys):
+        out[i, :len(a)] = a
+    return out
+
+
+class Catalogue:
+    """Каталог кодов; data -- словарь массивов или открытый npz (чтение по требованию)."""
+
+    def __init__(self, n, p, data):
+        self.n = n
+        self.p = p
+        self._data = data
+        self._cache = {}
+
+    def _array(self, name):
+        if name not in self._cache:
+            self._cache[name] = self._data[name]
+        return self._cache[name]
+
+    def __len__(self):
+        return len(self._array("k"))
+
+    @property
+    def factors(self):
+        return [poly.trim(f.astype(np.int64)) for f in self._array("factors")]
+
+    @property
+    def has_distance(self):
+        return "d" in self._data
+
+    def matrix_ids(self):
+        return [int(i) for i in self._array("matrix_ids")]
+
+    def g(self, code_id):
+        return poly.trim(self._array("g")[code_id].astype(np.int64))
+
+    def h(self, code_id):
+        return poly.trim(self._array("h")[code_id].astype(np.int64))
+
+    def code(self, code_id):
+        """Запись кода в формате enumerate_codes плюс d и номера связанных кодов."""
+        d = int(self._array("d")[code_id]) if self.has_distance else None
+        return {
+            'id': code_id,
+            'indices': mask_indices(code_id, len(self._array("factors"))),
+            'g': self.g(code_id),
+            'h': self.h(code_id),
+            'k': int(self._array("k")[code_id]),
+            'd': d if d else None,  # 0 -- нулевой код или d не вычислялось
+            'dual': int(self._array("dual")[code_id]),
+            'recip': int(self._array("recip")[code_id]),
+        }
+
+    def codes(self):
+        for code_id in range(len(self)):
+            yield self.code(code_id)
+
+    def matrices(self, code_id):
+        """{'G', 'H', 'G_sys', 'H_sys'} для сохранённого кода или None."""
+        if code_id not in self.matrix_ids():
+            return None
+        return {name: self._array(f"{name}_{code_id}").astype(np.int64) for name in MATRICES}
+
+
+def build_catalogue(n, p, distances=True, matrix_ids=(), workers=None):
+    """Вычисляет каталог (N, p) целиком в памяти."""
+    factors = factor_xn_minus_1(n, p)
+    total = 1 << len(factors)
+    g = np.zeros((total, n + 1), dtype=_coeff_dtype(p))
+    h = np.zeros((total, n + 1), dtype=_coeff_dtype(p))
+    k = np.zeros(total, dtype=np.int32)
+    for code in enumerate_codes(n, p, factors):
+        g[code['id'], :len(code['g'])] = code['g']
+        h[code['id'], :len(code['h'])] = code['h']
+        k[code['id']] = code['k']
+
+    dual, recip, _, _ = relations(np.arange(total), reciprocal_permutation(factors, p))
+    data = {
+        "version": np.array(CACHE_VERSION),
+        "n": np.array(n),
+        "p": np.array(p),
+        "factors": _padded(factors, n, p),
+        "g": g,
+        "h": h,
+        "k": k,
+        "dual": dual,
+        "recip": recip,
+        "matrix_ids": np.zeros(0, dtype=np.int64),
+    }
+    if distances:
+        _add_distances(data, n, p, workers)
+    _add_matrices(data, n, p, matrix_ids)
+    return Catalogue(n, p, data)
+
+
+def _add_distances(data, n, p, workers=None):
+    """Массив d по сохранённым g (0 -- нулевой код)."""
+    d = minimum_distances([poly.trim(row.astype(np.int64)) for row in data["g"]], n, p, workers)
+    data["d"] = np.array([0 if x is None else x for x in d], dtype=np.int32)
+
+
+def _add_matrices(data, n, p, matrix_ids):
+    """Матрицы G, H, G_sys, H_sys для кодов matrix_ids, которых ещё нет в data."""
+    stored = set(np.asarray(data["matrix_ids"]).tolist())
+    for code_id in sorted(set(matrix_ids) - stored):
+        gi = poly.trim(data["g"][code_id].astype(np.int64))
+        hi = poly.trim(data["h"][code_id].astype(np.int64))
+        G_sys, H_sys = systematic_matrices(gi, n, p)
+        mats = (generator_matrix(gi, n, p), parity_matrix(hi, n, p), G_sys, H_sys)
+        for name, M in zip(MATRICES, mats):
+            data[f"{name}_{code_id}"] = M.astype(_coeff_dtype(p))
+    data["matrix_ids"] = np.array(sorted(stored | set(matrix_ids)), dtype=np.int64)
+
+
+def _cache_path(n, p, cache_dir):
+    return os.path.join(cache_dir, f"cyclic_{n}_{p}.npz")
+
+
+def _load(path, n, p):
+    """Открытый npz каталога (N, p) текущей версии или None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        data = np.load(path)
+        ok = int(data["version"]) == CACHE_VERSION and int(data["n"]) == n and int(data["p"]) == p
+    except (OSError, ValueError, KeyError):
+        return None
+    if not ok:
+        data.close()
+        return None
+    return data
+
+
+def _save(catalogue, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        np.savez_compressed(f, **catalogue._data)
+    os.replace(tmp_path, path)
+
+
+def get_catalogue(n, p, distances=True, matrix_ids=(), cache_dir=CACHE_DIR, workers=None):
+    """
+    Каталог (N, p) из кэша; при отсутствии он вычисляется и записывается на диск.
+    Если в кэше нет d или нужных матриц, досчитываются только они: остальные
+    массивы (в том числе уже вычисленные расстояния) берутся из файла.
+    """
+    path = _cache_path(n, p, cache_dir)
+    data = _load(path, n, p)
+    if data is None:
+        catalogue = build_catalogue(n, p, distances, matrix_ids, workers)
+    else:
+        need_d = distances and "d" not in data.files
+        need_ids = set(matrix_ids) - set(data["matrix_ids"].tolist())
+        if not need_d and not need_ids:
+            return Catalogue(n, p, data)
+        with data:
+            arrays = {name: data[name] for name in data.files}
+        if need_d:
+            _add_distances(arrays, n, p, workers)
+        _add_matrices(arrays, n, p, need_ids)
+        catalogue = Catalogue(n, p, arrays)
+    try:
+        _save(catalogue, path)
+    except OSError:
+        pass  # кэш необязателен: каталог может быть недоступен на запись
+    return catalogue
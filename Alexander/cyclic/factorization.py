@@ -0,0 +1,261 @@
+"""
+Разложение x^N - 1 на неприводимые множители над GF(q), q = p^s, через
+q-циклотомические классы вычетов по модулю N.
+
+Каждый класс C_j = {j, j*q, j*q^2, ...} mod N задаёт неприводимый множитель
+M_j(x) = prod_{i in C_j} (x - beta^i), где beta -- примитивный корень N-й
+степени из единицы в GF(q^m), m = ord_N(q).
+
+Если таблица GF(q^m) не больше 2 N на множитель (_use_table), M_j строятся
+в табличном поле. Иначе поле не строится: x^N - 1 = prod_{d | N} Phi_d(x),
+и каждый круговой полином Phi_d расщепляется на множители степени ord_d(q)
+в кольце GF(q)[y]/(Phi_d) (алгоритм Берлекэмпа: НОД(h, v - c) для элементов v,
+неподвижных при y -> y^q, -- следов Tr(a) = a + a^q + ... случайных a).
+Классы сопоставляются множителям подстановкой beta = y mod f, f | Phi_N.
+Для s > 1 в табличном пути коэффициенты переводятся из GF(q^m) в
+представление coefficient_field(q); в пути Phi_d вся арифметика -- над GF(q).
+
+    python -m cyclic.factorization        # сравнение скорости с sympy.factor_list
+"""
+import functools
+import math
+import sys
+import time
+
+import numpy as np
+
+from . import poly
+from .gf import TABLE_LIMIT, ExtensionField, coefficient_field, multiplicative_order, prime_power
+
+
+def cyclotomic_cosets(n, q):
+    """Классы {s, s*q, s*q^2, ...} mod n; элементы класса -- в порядке умножения на q."""
+    seen = np.zeros(n, dtype=bool)
+    cosets = []
+    for s in range(n):
+        if seen[s]:
+            continue
+        coset = []
+        j = s
+        while not seen[j]:
+            seen[j] = True
+            coset.append(j)
+            j = j * q % n
+        cosets.append(coset)
+    return cosets
+
+
+def _sort_key(item):
+    """Порядок множителей как у sympy.factor_list: по степени, затем по коэффициентам от старшего."""
+    coeffs = item[1]
+    return len(coeffs), tuple(int(c) for c in coeffs[::-1])
+
+
+def _gcd(a, b, q):
+    """Нормированный НОД полиномов над GF(q)."""
+    a, b = poly.trim(a), poly.trim(b)
+    while poly.degree(b) >= 0:
+        a, b = b, poly.divmod_(a, b, q)[1]
+    return poly.monic(a, q)
+
+
+def _powers_mod(f, count, q):
+    """Строка k -- y^k mod f для k = 0..count-1 (f нормирован, коэффициенты над GF(q))."""
+    F = coefficient_field(q)
+    D = poly.degree(f)
+    low = F.neg(np.asarray(f[:D]))  # y^D = -f_0 - f_1 y - ... mod f
+    rows = np.zeros((count, D), dtype=np.int64)
+    row = np.zeros(D, dtype=np.int64)
+    row[0] = 1
+    for k in range(count):
+        rows[k] = row
+        top = row[-1]
+        row = np.concatenate(([0], row[:-1]))
+        if top:
+            row = F.add(row, F.mul(top, low))
+    return rows
+
+
+@functools.lru_cache(maxsize=None)
+def _cyclotomic(d, p):
+    """Круговой полином Phi_d по модулю p: (x^d - 1) / prod_{e | d, e < d} Phi_e."""
+    f = poly.xn_minus_1(d, p)
+    for e in range(1, d):
+        if d % e == 0:
+            f = poly.divmod_(f, _cyclotomic(e, p), p)[0]
+    f.flags.writeable = False
+    return f
+
+
+def cyclotomic_poly(d, q):
+    """Phi_d над GF(q): коэффициенты лежат в простом подполе GF(p)."""
+    return _cyclotomic(d, prime_power(q)[0]).copy()
+
+
+def _split_cyclotomic(d, q, seed=0):
+    """
+    Неприводимые множители Phi_d над GF(q) (все степени m = ord_d(q)).
+    След Tr(y^i) = sum_j y^(i q^j mod d) неподвижен при y -> y^q; случайная
+    комбинация следов v принимает значения из GF(q) на каждом множителе, и
+    h = prod_c НОД(h, v - c) расщепляет h, пока все множители не станут степени m.
+    """
+    F = coefficient_field(q)
+    phi = cyclotomic_poly(d, q)
+    D = poly.degree(phi)
+    m = multiplicative_order(q, d)
+    if D == m:
+        return [phi]
+    T = _powers_mod(phi, d, q)
+    qj = np.ones(m, dtype=np.int64)
+    for j in range(1, m):
+        qj[j] = qj[j - 1] * q % d
+    traces = F.sum(T[np.arange(D)[:, None] * qj % d], axis=1)  # строка i -- Tr(y^i)
+    rng = np.random.default_rng(seed)
+    factors = [phi]
+    while any(poly.degree(h) > m for h in factors):
+        v = F.matmul(rng.integers(0, q, (1, D)), traces)[0]
+        split = []
+        for h in factors:
+            w = poly.divmod_(v, h, q)[1]
+            if poly.degree(h) == m or poly.degree(w) < 1:
+                split.append(h)
+                continue
+            for c in range(q):
+                g = _gcd(h, poly.sub(w, [c], q), q)
+                if poly.degree(g) > 0:
+                    split.append(g)
+        factors = split
+    return factors
+
+
+def _coset_pairs(n, q, seed=0):
+    """
+    Пары (класс, множитель) без построения GF(q^m): Phi_d расщепляются по
+    отдельности, beta = y mod f для первого множителя f полинома Phi_n, и классу
+    C с представителем c сопоставляется множитель g с g(beta^c) = 0.
+    """
+    F = coefficient_field(q)
+    split = {d: _split_cyclotomic(d, q, seed) for d in range(1, n + 1) if n % d == 0}
+    beta = _powers_mod(split[n][0], n, q)  # строка k -- beta^k в базисе 1, y, y^2, ...
+    pairs = []
+    for coset in cyclotomic_cosets(n, q):
+        c = coset[0]
+        candidates = split[n // math.gcd(c, n)]
+        for i, g in enumerate(candidates):
+            value = F.sum(F.mul(g[:, None], beta[c * np.arange(len(g)) % n]), axis=0)
+            if not np.any(value):
+                pairs.append((coset, candidates.pop(i)))
+                break
+        else:
+            raise ArithmeticError(f"Для класса {coset} не найден множитель")
+    return pairs
+
+
+def _use_table(n, q, m, cosets):
+    """
+    Табличное GF(q^m) строится за O(q^m), расщепление Phi_d -- порядка N на
+    множитель; порог 2 N подобран по замерам для N < 600, p <= 7.
+    """
+    return q ** m <= min(TABLE_LIMIT, 2 * n * len(cosets))
+
+
+def _extension_pairs(n, q, m):
+    """Пары (класс, множитель) над GF(q), q = p^s, s > 1: через вложение GF(q) в GF(q^m)."""
+    F = coefficient_field(q)
+    big = ExtensionField(F.p, F.m * m)
+    phi = big.subfield_map(F)
+    back = np.full(big.order, -1, dtype=np.int64)
+    back[phi] = np.arange(q)
+    beta = big.root_of_unity(n)
+    pairs = []
+    for coset in cyclotomic_cosets(n, q):
+        coeffs = back[big.poly_from_roots(big.power(beta, np.asarray(coset)))]
+        if np.any(coeffs < 0):
+            raise ArithmeticError(f"Минимальный полином не лежит над GF({q})")
+        pairs.append((coset, coeffs))
+    return pairs
+
+
+def cyclotomic_factorization(n, q):
+    """
+    Список пар (класс вычетов, множитель) для x^n - 1 над GF(q), q = p^s.
+    Множители -- нормированные целочисленные массивы (от младшей степени),
+    коэффициенты -- элементы coefficient_field(q).
+    """
+    if n < 1:
+        raise ValueError(f"Длина кода должна быть положительной, получено {n}")
+    p, s = prime_power(q)
+    if math.gcd(n, p) != 1:
+        raise ValueError(f"Требуется НОД(N, p) = 1 (N={n}, p={p}): иначе x^N - 1 имеет кратные корни")
+
+    m = multiplicative_order(q, n)
+    cosets = cyclotomic_cosets(n, q)
+    if not _use_table(n, q, m, cosets):
+        pairs = _coset_pairs(n, q)
+    elif s > 1:
+        pairs = _extension_pairs(n, q, m)
+    else:
+        field = ExtensionField(p, m)
+        beta = field.root_of_unity(n)
+        pairs = [(coset, field.minimal_poly(beta, coset)) for coset in cosets]
+    return sorted(pairs, key=_sort_key)
+
+
+def factor_xn_minus_1(n, q):
+    """Неприводимые множители x^n - 1 над GF(q) (для простого q -- как в sympy.factor_list)."""
+    return [f for _, f in cyclotomic_factorization(n, q)]
+
+
+def benchmark_factorization(lengths=(11, 23, 25, 40, 121, 242, 400, 728), primes=(2, 3, 5), sympy_limit=10.0):
+    """
+    Время разложения x^N - 1: классы вычетов против sympy.factor_list.
+    Если sympy на предыдущей длине работал дольше sympy_limit секунд, он пропускается.
+    В конце перечисляются случаи, где sympy быстрее.
+    """
+    import sympy
+    from sympy import Poly, symbols, GF
+
+    x = symbols('x')
+    factor_xn_minus_1(7, 2), factor_xn_minus_1(17, 2)  # первые вызовы (ленивые импорты NumPy) вне замеров
+    sympy.factor_list(Poly(x**7 - 1, x, domain=GF(2)))
+    print(f"{'p':<3} | {'N':<5} | {'m':<4} | {'множ.':<6} | {'путь':<7} | {'классы, с':<10} | {'sympy, с':<10} | совпадение")
+    print("-" * 80)
+    losses = []
+    for p in primes:
+        skip_sympy = False
+        for n in lengths:
+            if math.gcd(n, p) != 1:
+                continue
+            start = time.perf_counter()
+            factors = factor_xn_minus_1(n, p)
+            t_ours = time.perf_counter() - start
+
+            t_sympy, same = float('nan'), "-"
+            if not skip_sympy:
+                start = time.perf_counter()
+                ref = sympy.factor_list(Poly(x**n - 1, x, domain=GF(p)))[1]
+                t_sympy = time.perf_counter() - start
+                ref_keys = sorted(poly.to_key(poly.monic([int(c) % p for c in f.all_coeffs()[::-1]], p))
+                                  for f, _ in ref)
+                same = "да" if ref_keys == sorted(poly.to_key(f) for f in factors) else "НЕТ"
+                skip_sympy = t_sympy > sympy_limit
+                if t_sympy < t_ours:
+                    losses.append((p, n, t_ours, t_sympy))
+
+            m = multiplicative_order(p, n)
+            path = "таблица" if _use_table(n, p, m, cyclotomic_cosets(n, p)) else "Phi_d"
+            print(f"{p:<3} | {n:<5} | {m:<4} | {len(factors):<6} | {path:<7} | {t_ours:<10.4f} | {t_sympy:<10.4f} | {same}")
+    if losses:
+        print("\nsympy быстрее:")
+        for p, n, t_ours, t_sympy in losses:
+            print(f"  p={p}, N={n}: {t_ours:.4f} с против {t_sympy:.4f} с ({t_ours / t_sympy:.1f}x)")
+    else:
+        print("\nsympy нигде не быстрее")
+    return losses
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        benchmark_factorization(lengths=[int(a) for a in sys.argv[1:]])
+    else:
+        benchmark_factorization()
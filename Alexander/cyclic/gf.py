@@ -0,0 +1,258 @@
+"""
+Арифметика конечных полей для циклических кодов.
+
+PrimeField     -- GF(p), операции по модулю p.
+ExtensionField -- табличная реализация GF(p^m) (log/antilog), элементы -- целые
+0..p^m-1 (цифры в системе счисления p = коэффициенты в полиномиальном базисе).
+Оба класса -- поля коэффициентов кодов: одинаковый набор векторизованных
+операций (add, sub, neg, mul, inv, sum, convolve, matmul).
+Поля разложения, не выгодные для таблиц, не строятся: см. factorization.
+"""
+import functools
+
+import numpy as np
+
+from . import poly
+
+TABLE_LIMIT = 2 ** 20
+
+
+def prime_factors(n):
+    """Различные простые делители n (перебором делителей)."""
+    factors = []
+    d = 2
+    while d * d <= n:
+        if n % d == 0:
+            factors.append(d)
+            while n % d == 0:
+                n //= d
+        d += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def multiplicative_order(q, n):
+    """Наименьшее m > 0 с q^m = 1 (mod n)."""
+    if n == 1:
+        return 1
+    m, value = 1, q % n
+    while value != 1:
+        value = value * q % n
+        m += 1
+        if m > n:
+            raise ValueError(f"{q} не обратим по модулю {n}")
+    return m
+
+
+def prime_power(q):
+    """(p, m) для q = p^m; ValueError, если q не степень простого."""
+    factors = prime_factors(q) if q > 1 else []
+    if len(factors) != 1:
+        raise ValueError(f"{q} не является степенью простого числа")
+    p, m = factors[0], 0
+    while q > 1:
+        q //= p
+        m += 1
+    return p, m
+
+
+class PrimeField:
+    """GF(p): элементы -- целые 0..p-1, операции векторизованы."""
+
+    def __init__(self, p):
+        self.p = p
+        self.m = 1
+        self.order = p
+
+    def add(self, a, b):
+        return (np.asarray(a) + b) % self.p
+
+    def neg(self, a):
+        return -np.asarray(a) % self.p
+
+    def sub(self, a, b):
+        return (np.asarray(a) - b) % self.p
+
+    def mul(self, a, b):
+        return np.asarray(a) * b % self.p
+
+    def inv(self, a):
+        a = np.asarray(a)
+        if np.any(a % self.p == 0):
+            raise ValueError("Обратного элемента для 0 не существует")
+        if a.ndim == 0:
+            return np.int64(pow(int(a), self.p - 2, self.p))
+        return np.array([pow(int(x), self.p - 2, self.p) for x in a.ravel()], dtype=np.int64).reshape(a.shape)
+
+    def sum(self, a, axis=None):
+        return np.asarray(a).sum(axis=axis) % self.p
+
+    def convolve(self, a, b):
+        return np.convolve(a, b) % self.p
+
+    def matmul(self, A, B):
+        return np.asarray(A) @ B % self.p
+
+
+def _int_to_poly(value, p, m):
+    return np.array([(value // p ** i) % p for i in range(m)], dtype=np.int64)
+
+
+def find_primitive_poly(p, m):
+    """Наименьший (в лексикографическом порядке) примитивный полином степени m над GF(p)."""
+    order = p ** m - 1
+    cofactors = [order // r for r in prime_factors(order)]
+    x = np.array([0, 1], dtype=np.int64)
+    for low in range(1, p ** m):
+        f = np.append(_int_to_poly(low, p, m), 1)
+        if f[0] == 0:
+            continue
+        if poly.to_key(poly.powmod(x, order, f, p)) != (1,):
+            continue
+        if all(poly.to_key(poly.powmod(x, e, f, p)) != (1,) for e in cofactors):
+            return f
+    raise ValueError(f"Примитивный полином степени {m} над GF({p}) не найден")
+
+
+class ExtensionField:
+    """GF(p^m) с таблицами exp/log; операции векторизованы по массивам элементов."""
+
+    def __init__(self, p, m, primitive_poly=None):
+        self.p = p
+        self.m = m
+        self.order = p ** m
+        if self.order > TABLE_LIMIT:
+            raise ValueError(f"GF({p}^{m}) слишком велико для таблиц (> {TABLE_LIMIT} элементов)")
+        self.poly = find_primitive_poly(p, m) if primitive_poly is None else np.asarray(primitive_poly)
+        self.powers = p ** np.arange(m, dtype=np.int64)
+        self._build_tables()
+
+    def _build_tables(self):
+        p, m, n = self.p, self.m, self.order - 1
+        # Умножение на x -- линейное отображение X над GF(p): строка i = x^(i+1) mod f
+        X = np.zeros((m, m), dtype=np.int64)
+        X[:-1, 1:] = np.eye(m - 1, dtype=np.int64)
+        X[-1] = -self.poly[:m] % p
+
+        # Первый блок степеней alpha^0..alpha^(B-1) последовательно, далее блоками через X^B
+        B = int(np.ceil(np.sqrt(n)))
+        digits = np.zeros((n + B, m), dtype=np.int64)
+        digits[0, 0] = 1
+        for i in range(1, B):
+            digits[i] = digits[i - 1] @ X % p
+        XB = np.eye(m, dtype=np.int64)
+        for _ in range(B):
+            XB = XB @ X % p
+        for start in range(B, n, B):
+            digits[start:start + B] = digits[start - B:start] @ XB % p
+
+        exp = digits[:n] @ self.powers
+        self.exp = np.concatenate((exp, exp))  # удвоенная таблица: без взятия остатка по n
+        self.log = np.zeros(self.order, dtype=np.int64)
+        self.log[exp] = np.arange(n)
+
+    # --- векторизованные операции над целочисленными представлениями ---
+    def add(self, a, b):
+        if self.p == 2:
+            return np.bitwise_xor(a, b)
+        a, b = np.asarray(a), np.asarray(b)
+        da = (a[..., None] // self.powers) % self.p
+        db = (b[..., None] // self.powers) % self.p
+        return ((da + db) % self.p) @ self.powers
+
+    def neg(self, a):
+        if self.p == 2:
+            return np.asarray(a)
+        da = (np.asarray(a)[..., None] // self.powers) % self.p
+        return (-da % self.p) @ self.powers
+
+    def sub(self, a, b):
+        return self.add(a, self.neg(b))
+
+    def mul(self, a, b):
+        a, b = np.asarray(a), np.asarray(b)
+        res = self.exp[self.log[a] + self.log[b]]
+        return np.where((a == 0) | (b == 0), 0, res)
+
+    def inv(self, a):
+        a = np.asarray(a)
+        if np.any(a == 0):
+            raise ZeroDivisionError("Обратного элемента для 0 не существует")
+        return self.exp[(self.order - 1 - self.log[a]) % (self.order - 1)]
+
+    def power(self, a, e):
+        a, e = np.asarray(a), np.asarray(e)
+        res = self.exp[(self.log[a] * e) % (self.order - 1)]
+        return np.where(a == 0, np.where(e == 0, 1, 0), res)
+
+    def sum(self, a, axis=None):
+        a = np.asarray(a)
+        if axis is None:
+            a, axis = a.ravel(), 0
+        if self.p == 2:
+            return np.bitwise_xor.reduce(a, axis=axis)
+        digits = (a[..., None] // self.powers) % self.p
+        return (digits.sum(axis=axis % a.ndim) % self.p) @ self.powers
+
+    def convolve(self, a, b):
+        """Произведение полиномов с коэффициентами из поля."""
+        a, b = np.asarray(a), np.asarray(b)
+        prod = self.mul(a[:, None], b[None, :])
+        Z = np.zeros((len(a), len(a) + len(b) - 1), dtype=np.int64)
+        Z[np.arange(len(a))[:, None], np.arange(len(a))[:, None] + np.arange(len(b))] = prod
+        return self.sum(Z, axis=0)
+
+    def matmul(self, A, B):
+        return self.sum(self.mul(np.asarray(A)[:, :, None], np.asarray(B)[None, :, :]), axis=1)
+
+    # --- корни из единицы и минимальные полиномы ---
+    def root_of_unity(self, n):
+        """Примитивный корень n-й степени из единицы: alpha^((p^m - 1) / n)."""
+        if (self.order - 1) % n:
+            raise ValueError(f"{n} не делит {self.order - 1}")
+        return int(self.exp[(self.order - 1) // n])
+
+    def subfield_map(self, sub):
+        """
+        Вложение поля sub = GF(p^s) (s | m): массив phi, phi[x] -- образ элемента x.
+        Образом примитивного элемента sub служит корень его примитивного полинома.
+        """
+        if self.m % sub.m or sub.p != self.p:
+            raise ValueError(f"GF({sub.order}) не является подполем GF({self.order})")
+        step = (self.order - 1) // (sub.order - 1)
+        # корни примитивного полинома sub -- примитивные элементы подполя alpha^(step*j)
+        candidates = [j for j in range(1, sub.order - 1) if np.gcd(j, sub.order - 1) == 1]
+        coeffs = np.asarray(sub.poly)
+        for j in candidates:
+            theta = int(self.exp[step * j])
+            powers = self.power(theta, np.arange(len(coeffs)))
+            if not self.sum(self.mul(coeffs, powers)):
+                phi = np.zeros(sub.order, dtype=np.int64)
+                phi[sub.exp[:sub.order - 1]] = self.exp[(step * j * np.arange(sub.order - 1)) % (self.order - 1)]
+                return phi
+        raise ArithmeticError(f"Корень примитивного полинома GF({sub.order}) не найден")
+
+    def poly_from_roots(self, roots):
+        """Коэффициенты prod (x - r) от младшей степени к старшей."""
+        coeffs = np.ones(1, dtype=np.int64)
+        for r in np.asarray(roots):
+            shifted = np.concatenate(([0], coeffs))
+            scaled = np.concatenate((self.mul(r, coeffs), [0]))
+            coeffs = self.sub(shifted, scaled)
+        return coeffs
+
+    def minimal_poly(self, beta, exponents):
+        """prod_{j in exponents} (x - beta^j) с коэффициентами из GF(p)."""
+        coeffs = self.poly_from_roots(self.power(beta, np.asarray(exponents)))
+        if np.any(coeffs >= self.p):
+            raise ArithmeticError("Минимальный полином не лежит над простым подполем")
+        return coeffs
+
+
+@functools.lru_cache(maxsize=None)
+def coefficient_field(q):
+    """Поле коэффициентов GF(q): PrimeField для простого q, иначе табличное ExtensionField."""
+    p, m = prime_power(q)
+    return PrimeField(p) if m == 1 else ExtensionField(p, m)
+
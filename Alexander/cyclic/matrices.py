@@ -0,0 +1,96 @@
+"""
+Порождающие и проверочные матрицы циклических кодов над GF(q) в целочисленных массивах
+(p -- порядок поля коэффициентов или объект поля, как в poly).
+
+Систематическая форма [I | P] строится напрямую из остатков x^(n-k+i) mod g(x),
+без рационального RREF; для произвольных матриц есть приведение Гаусса -- Жордана
+над полем коэффициентов.
+"""
+import numpy as np
+
+from . import poly
+
+
+def shift_matrix(a, rows, n):
+    """Матрица rows x n, строка i -- коэффициенты x^i * a(x)."""
+    a = poly.trim(a)
+    M = np.zeros((rows, n), dtype=np.int64)
+    idx = np.arange(rows)[:, None] + np.arange(len(a))
+    keep = idx < n
+    M[np.nonzero(keep)[0], idx[keep]] = np.broadcast_to(a, idx.shape)[keep]
+    return M
+
+
+def generator_matrix(g, n, p):
+    """Классическая G (k x n): строки -- сдвиги g(x)."""
+    return shift_matrix(g, n - poly.degree(g), n)
+
+
+def parity_matrix(h, n, p):
+    """Классическая H ((n-k) x n): строки -- сдвиги нормированного h*(x)."""
+    return shift_matrix(poly.reciprocal(h, p), n - poly.degree(h), n)
+
+
+def systematic_matrices(g, n, p):
+    """
+    (G_sys, H_sys) = ([I | P], [-P^T | I]) для кода с порождающим g(x).
+    Строка i: x^i - x^k * (x^(n-k+i) mod g) -- циклический сдвиг
+    стандартного систематического кодового слова.
+    """
+    F = poly.field(p)
+    g = poly.monic(g, p)
+    r = poly.degree(g)
+    k = n - r
+    P = np.zeros((k, r), dtype=np.int64)
+    if r > 0:
+        tail = F.neg(g[:r])  # x^r mod g для нормированного g
+        rem = tail.copy()
+        for i in range(k):
+            P[i] = F.neg(rem)
+            top = rem[-1]
+            rem = F.add(np.concatenate(([0], rem[:-1])), F.mul(top, tail))
+    G_sys = np.hstack((np.eye(k, dtype=np.int64), P))
+    H_sys = np.hstack((F.neg(P.T), np.eye(r, dtype=np.int64)))
+    return G_sys, H_sys
+
+
+def rref_mod_p(M, p):
+    """Приведённый ступенчатый вид матрицы над полем коэффициентов: (R, номера ведущих столбцов)."""
+    F = poly.field(p)
+    R = np.array(M, dtype=np.int64)
+    rows, cols = R.shape
+    pivots = []
+    row = 0
+    for col in range(cols):
+        if row == rows:
+            break
+        nz = np.nonzero(R[row:, col])[0]
+        if not len(nz):
+            continue
+        piv = row + nz[0]
+        R[[row, piv]] = R[[piv, row]]
+        R[row] = F.mul(R[row], F.inv(R[row, col]))
+        factors = R[:, col].copy()
+        factors[row] = 0
+        R = F.sub(R, F.mul(factors[:, None], R[row][None, :]))
+        pivots.append(col)
+        row += 1
+    return R, tuple(pivots)
+
+
+def systematic_from_matrix(G, p):
+    """
+    [I | P] и [-P^T | I] для произвольной порождающей матрицы.
+    Возвращает (None, None), если первые k столбцов зависимы.
+    """
+    k, n = G.shape
+    R, pivots = rref_mod_p(G, p)
+    if pivots != tuple(range(k)):
+        return None, None
+    P = R[:k, k:]
+    return R[:k], np.hstack((poly.field(p).neg(P.T), np.eye(n - k, dtype=np.int64)))
+
+
+def is_orthogonal(G, H, p):
+    """G * H^T = 0 над полем коэффициентов."""
+    return not np.any(poly.field(p).matmul(G, H.T))
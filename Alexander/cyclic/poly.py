@@ -0,0 +1,131 @@
+"""
+Полиномы над конечным полем GF(q) как целочисленные массивы NumPy.
+
+Коэффициенты хранятся от младшей степени к старшей: a[i] -- коэффициент при x^i
+(в отличие от sympy all_coeffs(), где первым идёт старший коэффициент).
+Параметр p -- порядок поля коэффициентов (простое число или его степень)
+либо готовый объект поля из gf; для простого p арифметика -- по модулю p.
+"""
+import numpy as np
+
+
+_fields = {}
+
+
+def field(p):
+    """Объект поля коэффициентов для p (целое -- gf.coefficient_field(p))."""
+    F = _fields.get(p)
+    if F is not None:
+        return F
+    if isinstance(p, (int, np.integer)):
+        from .gf import coefficient_field
+        F = _fields[p] = coefficient_field(int(p))
+        return F
+    return p
+
+
+def trim(a):
+    """Убирает нулевые старшие коэффициенты (нулевой полином -> [0])."""
+    a = np.asarray(a, dtype=np.int64)
+    nz = np.nonzero(a)[0]
+    return a[:nz[-1] + 1].copy() if len(nz) else np.zeros(1, dtype=np.int64)
+
+
+def degree(a):
+    nz = np.nonzero(a)[0]
+    return int(nz[-1]) if len(nz) else -1
+
+
+def inv_mod(a, p):
+    """Мультипликативная инверсия в поле коэффициентов."""
+    if a == 0 or (isinstance(p, (int, np.integer)) and a % p == 0):
+        raise ValueError("Обратного элемента для 0 не существует")
+    return int(field(p).inv(a))
+
+
+def _pad(a, size):
+    res = np.zeros(size, dtype=np.int64)
+    res[:len(a)] = a
+    return res
+
+
+def add(a, b, p):
+    size = max(len(a), len(b))
+    return trim(field(p).add(_pad(a, size), _pad(b, size)))
+
+
+def sub(a, b, p):
+    size = max(len(a), len(b))
+    return trim(field(p).sub(_pad(a, size), _pad(b, size)))
+
+
+def mul(a, b, p):
+    return trim(field(p).convolve(a, b))
+
+
+def monic(a, p):
+    """Нормирует полином (старший коэффициент = 1)."""
+    a = trim(a)
+    lc = int(a[-1])
+    if lc in (0, 1):
+        return a
+    F = field(p)
+    return F.mul(a, F.inv(lc))
+
+
+def divmod_(a, b, p):
+    """Деление с остатком: a = q * b + r, deg r < deg b."""
+    F = field(p)
+    a = trim(a).copy()
+    b = trim(b)
+    db = degree(b)
+    if db < 0:
+        raise ZeroDivisionError("Деление на нулевой полином")
+    if degree(a) < db:
+        return np.zeros(1, dtype=np.int64), a
+    q = np.zeros(len(a) - db, dtype=np.int64)
+    if F.m == 1:
+        # простое поле: скалярная арифметика по модулю p без вызовов методов поля
+        p = F.p
+        inv_lc = pow(int(b[-1]), p - 2, p)
+        for i in range(len(a) - 1, db - 1, -1):
+            c = a[i] * inv_lc % p
+            if c:
+                q[i - db] = c
+                a[i - db:i + 1] = (a[i - db:i + 1] - c * b) % p
+    else:
+        inv_lc = F.inv(b[-1])
+        for i in range(len(a) - 1, db - 1, -1):
+            c = F.mul(a[i], inv_lc)
+            if c:
+                q[i - db] = c
+                a[i - db:i + 1] = F.sub(a[i - db:i + 1], F.mul(c, b))
+    return trim(q), trim(a[:db] if db > 0 else np.zeros(1, dtype=np.int64))
+
+
+def powmod(a, e, f, p):
+    """a^e mod f (быстрое возведение в степень)."""
+    result = np.ones(1, dtype=np.int64)
+    base = divmod_(a, f, p)[1]
+    while e > 0:
+        if e & 1:
+            result = divmod_(mul(result, base, p), f, p)[1]
+        base = divmod_(mul(base, base, p), f, p)[1]
+        e >>= 1
+    return result
+
+
+def reciprocal(a, p):
+    """Нормированный возвратный полином a*(x) = a(0)^(-1) * x^deg * a(1/x)."""
+    return monic(trim(trim(a)[::-1]), p)
+
+
+def xn_minus_1(n, p):
+    a = np.zeros(n + 1, dtype=np.int64)
+    a[0], a[n] = field(p).neg(1), 1
+    return a
+
+
+def to_key(a):
+    """Канонический ключ полинома для словарей и сравнения."""
+    return tuple(int(c) for c in trim(a))
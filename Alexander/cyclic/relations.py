@@ -0,0 +1,52 @@
+"""
+Двойственные и возвратные коды через перестановку множителей x^N - 1.
+
+Возвратный полином неприводимого множителя -- снова множитель, поэтому
+взятие возвратного -- перестановка pi на номерах множителей:
+    возвратный к коду с маской M  -> pi(M),
+    двойственный (g = h*)         -> pi(~M).
+Все связи вычисляются над массивами масок без поиска по каталогу.
+"""
+import numpy as np
+
+from . import poly
+
+
+def reciprocal_permutation(factors, p):
+    """perm[i] -- номер (с 0) множителя, возвратного к factors[i]."""
+    index = {poly.to_key(f): i for i, f in enumerate(factors)}
+    perm = []
+    for f in factors:
+        key = poly.to_key(poly.reciprocal(f, p))
+        if key not in index:
+            raise ValueError(f"Возвратный к {key} не найден среди множителей")
+        perm.append(index[key])
+    return perm
+
+
+def permute_masks(masks, perm):
+    """Образ масок при перестановке множителей (f_1 -- старший бит), векторно по массиву."""
+    m = len(perm)
+    masks = np.asarray(masks, dtype=np.int64)
+    out = np.zeros_like(masks)
+    for i, j in enumerate(perm):
+        out |= ((masks >> (m - 1 - i)) & 1) << (m - 1 - j)
+    return out
+
+
+def relations(masks, perm):
+    """
+    Для массива масок возвращает (dual, recip, self_dual, reversible):
+    маски двойственных и возвратных кодов и признаки dual == M, recip == M.
+    """
+    m = len(perm)
+    masks = np.asarray(masks, dtype=np.int64)
+    full = (1 << m) - 1
+    recip = permute_masks(masks, perm)
+    dual = full ^ recip  # pi(~M) = ~pi(M)
+    return dual, recip, dual == masks, recip == masks
+
+
+def code_index(codes):
+    """Индекс каталога: канонический ключ g(x) -> id кода."""
+    return {poly.to_key(c['g']): c['id'] for c in codes}
@@ -0,0 +1,164 @@
+"""
+Каталог циклических кодов по диапазонам N и q с пулом процессов.
+
+Каждая пара (N, q) раскладывается в отдельной задаче, затем её коды
+перебираются кусками по диапазонам масок (enumerate_codes(start, stop)).
+Куски выполняются в пуле, одновременно в работе не больше window задач,
+а записи сразу дописываются в JSONL -- память не зависит от размера каталога.
+
+Пары с числом множителей больше max_factors (2^max_factors кодов) пропускаются.
+Минимальные расстояния (--distance) считаются в пределах budget секунд на
+пару, поровну на её куски: у кодов, до которых очередь не дошла, в записи
+"d": null, а в статусе пары -- сколько расстояний посчитано.
+
+    python -m cyclic.sweep --n 2:40 --q 2,3,4,5 --out codes.jsonl --workers 4
+    python -m cyclic.sweep --n 11,23 --q 3 --distance --budget 120 --out codes.jsonl
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from parallel import bounded
+
+from .distance import minimum_distance
+from .enumeration import enumerate_codes, mask_ranges
+from .factorization import factor_xn_minus_1
+from .gf import prime_power
+from .matrices import generator_matrix
+from .relations import reciprocal_permutation, relations
+
+CHUNK = 4096  # кодов в одной задаче пула
+MAX_FACTORS = 14  # не больше 2^14 кодов на пару (N, q)
+BUDGET = 20.0     # секунд на минимальные расстояния одной пары
+
+
+def parse_range(text):
+    """'2:40' -> 2..40 включительно, '11,23' -> [11, 23]; части можно комбинировать."""
+    values = []
+    for part in text.split(","):
+        if ":" in part:
+            lo, hi = part.split(":")
+            values.extend(range(int(lo), int(hi) + 1))
+        elif part:
+            values.append(int(part))
+    return values
+
+
+def _factor_task(args):
+    n, q = args
+    start = time.perf_counter()
+    try:
+        factors, error = factor_xn_minus_1(n, q), None
+    except ValueError as e:  # например, НОД(N, p) > 1
+        factors, error = None, str(e)
+    return n, q, factors, error, time.perf_counter() - start
+
+
+def _chunk_task(args):
+    n, q, factors, start, stop, distance, limit = args
+    t0 = time.perf_counter()
+    codes = list(enumerate_codes(n, q, factors, start=start, stop=stop))
+    ids = np.array([c['id'] for c in codes], dtype=np.int64)
+    dual, recip, self_dual, reversible = relations(ids, reciprocal_permutation(factors, q))
+    dists = [None] * len(codes)
+    computed = 0
+    if distance:
+        deadline = None if limit is None else t0 + limit
+        try:
+            for i, c in enumerate(codes):
+                dists[i] = minimum_distance(generator_matrix(c['g'], n, q), q, deadline)
+                computed += 1
+        except TimeoutError:
+            pass  # бюджет куска исчерпан: остальным кодам "d": null
+    lines = []
+    for i, c in enumerate(codes):
+        lines.append(json.dumps({
+            "n": n, "q": q, "id": c['id'], "k": c['k'], "d": dists[i],
+            "g": c['g'].tolist(), "h": c['h'].tolist(),
+            "dual": int(dual[i]), "recip": int(recip[i]),
+            "self_dual": bool(self_dual[i]), "reversible": bool(reversible[i]),
+        }))
+    return n, q, lines, computed, time.perf_counter() - t0
+
+
+def sweep(lengths, orders, out, workers=None, distance=False, max_factors=MAX_FACTORS, chunk=CHUNK,
+          budget=BUDGET):
+    """
+    Пишет записи кодов всех пар (N, q) в файл out (JSONL).
+    budget -- секунд на расстояния одной пары (None -- без предела).
+    Возвращает словарь (N, q) -> {'codes', 'distances', 'factor_s', 'codes_s', 'status'}.
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = {}
+    pairs = []
+    for q in orders:
+        p, _ = prime_power(q)
+        for n in lengths:
+            if math.gcd(n, p) != 1:
+                stats[(n, q)] = {'codes': 0, 'distances': 0, 'factor_s': 0.0, 'codes_s': 0.0,
+                                 'status': "НОД(N, p) > 1"}
+            else:
+                pairs.append((n, q))
+
+    with ProcessPoolExecutor(workers) as pool, open(out, "w", encoding="utf-8") as f:
+        chunks = []
+        for n, q, factors, error, elapsed in bounded(pool, _factor_task, pairs, 2 * workers):
+            stats[(n, q)] = {'codes': 0, 'distances': 0, 'factor_s': elapsed, 'codes_s': 0.0,
+                             'status': error or "ok"}
+            if error:
+                continue
+            if len(factors) > max_factors:
+                stats[(n, q)]['status'] = f"пропущено: {len(factors)} множителей"
+                continue
+            parts = max(1, (1 << len(factors)) // chunk)
+            limit = None if budget is None else budget / parts
+            chunks.extend((n, q, factors, a, b, distance, limit) for a, b in mask_ranges(len(factors), parts))
+
+        for n, q, lines, computed, elapsed in bounded(pool, _chunk_task, chunks, 2 * workers):
+            f.write("\n".join(lines) + "\n")
+            s = stats[(n, q)]
+            s['codes'] += len(lines)
+            s['distances'] += computed
+            s['codes_s'] += elapsed
+            if distance and s['distances'] < s['codes']:
+                s['status'] = f"бюджет: d для {s['distances']} из {s['codes']}"
+    return stats
+
+
+def print_stats(stats, top=10):
+    rows = sorted(stats.items(), key=lambda item: -(item[1]['factor_s'] + item[1]['codes_s']))
+    print(f"{'N':<5} | {'q':<4} | {'кодов':<8} | {'разлож., с':<10} | {'коды, с':<9} | статус")
+    print("-" * 64)
+    for (n, q), s in rows[:top]:
+        print(f"{n:<5} | {q:<4} | {s['codes']:<8} | {s['factor_s']:<10.4f} | {s['codes_s']:<9.4f} | {s['status']}")
+    total = sum(s['codes'] for s in stats.values())
+    print(f"Всего пар: {len(stats)}, кодов: {total}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Каталог циклических кодов по диапазонам N и q")
+    parser.add_argument("--n", default="2:30", help="длины: '2:30' или '11,23'")
+    parser.add_argument("--q", default="2,3", help="порядки полей: '2,3,4'")
+    parser.add_argument("--out", default="cyclic_codes.jsonl")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--distance", action="store_true", help="вычислять минимальное расстояние")
+    parser.add_argument("--budget", type=float, default=BUDGET,
+                        help="секунд на расстояния одной пары (0 -- без предела)")
+    parser.add_argument("--max-factors", type=int, default=MAX_FACTORS, help="пропускать (N, q) с большим числом множителей")
+    parser.add_argument("--top", type=int, default=10, help="сколько самых долгих пар показать")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = sweep(parse_range(args.n), parse_range(args.q), args.out, args.workers,
+                  args.distance, args.max_factors, budget=args.budget or None)
+    print_stats(stats, args.top)
+    print(f"Записано в {args.out} за {time.perf_counter() - start:.2f} с")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,18 @@
-import sympy
-from sympy import symbols, Poly, GF, Matrix, eye
+from cyclic.catalogue import get_catalogue
+from cyclic.matrices import is_orthogonal
 
 N = 11      # Длина кода
-P = 3       # Характеристика поля F_3
+P = 3       # Порядок поля коэффициентов: простое (F_3) или степень простого (4, 8, 9)
 
 # === ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ ===
 
-def format_poly(poly, x_sym):
+def format_poly(coeffs, x_sym="x"):
     """
-    Красивый вывод полинома.
+    Красивый вывод полинома по коэффициентам (от младшей степени к старшей).
     Пример: 1*x^2 + 2 -> x^2 + 2
     """
-    if poly == 0 or poly == Poly(0, x_sym):
-        return "0"
-    
     # Коэффициенты от старшей степени к младшей
-    coeffs = [int(c) % P for c in poly.all_coeffs()]
+    coeffs = [int(c) % P for c in coeffs][::-1]
     degree = len(coeffs) - 1
     terms = []
     
@@ -38,215 +35,98 @@ def format_poly(poly, x_sym):
             
     return " + ".join(terms) if terms else "0"
 
-def normalize_poly(poly, domain):
-    """
-    Делает полином моническим (старший коэффициент = 1).
-    """
-    if poly == 0: return poly
-    lc = int(poly.LC()) % P
-    if lc == 1: return poly
-    # Умножаем на обратный к старшему коэффициенту
-    inv_lc = pow(lc, P - 2, P)
-    return poly * inv_lc
-
-def get_reciprocal_poly(poly, x_sym, domain):
-    """
-    Возвращает нормированный возвратный полином g*(x).
-    g*(x) = g(0)^(-1) * x^deg * g(1/x)
-    """
-    if poly == 0: return Poly(0, x_sym, domain=domain)
-    
-    coeffs = [int(c) % P for c in poly.all_coeffs()]
-    # Разворачиваем (a_n...a_0 -> a_0...a_n)
-    recip_coeffs = list(reversed(coeffs))
-    
-    # Убираем ведущие нули
-    while recip_coeffs and recip_coeffs[0] == 0:
-        recip_coeffs.pop(0)
-    
-    if not recip_coeffs: return Poly(0, x_sym, domain=domain)
-
-    # Создаем полином и нормализуем его
-    res_poly = Poly(recip_coeffs, x_sym, domain=domain)
-    return normalize_poly(res_poly, domain)
-
-def matrix_mod_p(M, p):
-    """Приводит элементы матрицы к [0, p-1]."""
-    return M.applyfunc(lambda x: int(x) % p)
-
-def get_cyclic_generator_matrix(g_poly, n, k, p):
-    """
-    Классическая G (k x n): строки - сдвиги g(x).
-    """
-    # coeffs: [g_r, ..., g_0] -> reverse -> [g_0, ..., g_r]
-    g_coeffs = [int(c) % p for c in g_poly.all_coeffs()]
-    g_coeffs.reverse()
-    
-    rows = []
-    for i in range(k):
-        row = [0] * n
-        for j, val in enumerate(g_coeffs):
-            if i + j < n:
-                row[i + j] = val
-        rows.append(row)
-    return Matrix(rows)
-
-def get_cyclic_parity_matrix(h_poly, n, r, p):
-    """
-    Классическая H (r x n): строки - сдвиги h*(x).
-    """
-    x = h_poly.gen
-    # Вычисляем h*(x)
-    h_recip = get_reciprocal_poly(h_poly, x, h_poly.domain)
-    
-    # Коэффициенты h*(x): [h*_0, ..., h*_k]
-    coeffs = [int(c) % p for c in h_recip.all_coeffs()]
-    coeffs.reverse() # Для вектора: [const, x, x^2...]
-    
-    rows = []
-    # Количество строк = n - k = r
-    for i in range(r):
-        row = [0] * n
-        for j, val in enumerate(coeffs):
-            if i + j < n:
-                row[i + j] = val
-        rows.append(row)
-    return Matrix(rows)
-
-def get_systematic_matrices(G_nonsys, n, k, p):
+def format_matrix(M):
     """
-    Пытается привести к виду [I | P].
-    Возвращает (G_sys, H_sys) или (None, None).
+    Вывод целочисленной матрицы в том же виде, что sympy.pprint
+    (без импорта sympy).
     """
-    # RREF
-    G_rref, pivot_cols = G_nonsys.rref()
-    G_sys = matrix_mod_p(G_rref[:k, :], p)
-    
-    expected_pivots = tuple(range(k))
-    if pivot_cols != expected_pivots:
-        return None, None
-    
-    # H = [-P^T | I]
-    P_matrix = G_sys[:k, k:]
-    Minus_P_T = matrix_mod_p(-P_matrix.T, p)
-    I_nk = eye(n - k)
-    
-    H_sys = Minus_P_T.row_join(I_nk)
-    return G_sys, H_sys
+    cells = [[str(int(v)) for v in row] for row in M]
+    widths = [max(len(row[j]) for row in cells) for j in range(len(cells[0]))]
+    lines = ["  ".join(v.center(w) for v, w in zip(row, widths)) for row in cells]
+    if len(lines) == 1:
+        return f"[{lines[0]}]"
+    blank = " " * len(lines[0])
+    out = []
+    for i, line in enumerate(lines):
+        left, right = ("⎡", "⎤") if i == 0 else ("⎣", "⎦") if i == len(lines) - 1 else ("⎢", "⎥")
+        out.append(f"{left}{line}{right}")
+        if i < len(lines) - 1:
+            out.append(f"⎢{blank}⎥")
+    return "\n".join(out)
 
 
 def solve():
-    x = symbols('x')
-    domain = GF(P)
+    targets = [1, 2]
+    # Каталог -- функция (N, P): при повторном запуске читается из кэша без sympy
+    catalogue = get_catalogue(N, P, matrix_ids=targets)
     
     print(f"=== ЗАДАНИЕ: Циклические коды (n={N}, p={P}) ===\n")
     
 
-    main_poly = Poly(x**N - 1, x, domain=domain)
-    factors_data = sympy.factor_list(main_poly)[1]
- 
-    irreducibles = [normalize_poly(f, domain) for f, exp in factors_data]
+    # Разложение через циклотомические классы (коэффициенты от младшей степени)
+    factors = catalogue.factors
     
     print(f"1) Неприводимые делители x^{N}-1:")
-    for i, f in enumerate(irreducibles):
-        print(f"   f_{i+1}(x) = {format_poly(f, x)}")
+    for i, f in enumerate(factors):
+        print(f"   f_{i+1}(x) = {format_poly(f)}")
     
-    num_codes = 2 ** len(irreducibles)
+    num_codes = len(catalogue)
     print(f"\n   Количество кодов: {num_codes}")
 
-    codes_list = []
-    
-    for i in range(num_codes):
-        mask = f"{i:0{len(irreducibles)}b}"
-        g = Poly(1, x, domain=domain)
-        factors_indices = []
-        
-        for idx, bit in enumerate(mask):
-            if bit == '1':
-                g = g * irreducibles[idx]
-                factors_indices.append(idx + 1)
-        
-        g = normalize_poly(g, domain)
-        h, rem = sympy.div(main_poly, g, domain=domain)
-        h = normalize_poly(h, domain)
-        k = N - g.degree()
-        
-        # Проверка целостности
-        check_prod = (g * h - main_poly).is_zero
-        
-        codes_list.append({
-            'id': i,
-            'indices': factors_indices,
-            'g': g,
-            'h': h,
-            'k': k,
-            'valid': check_prod
-        })
+    codes_list = list(catalogue.codes())
 
     print(f"\n2-3) Параметры кодов (выводим все {num_codes}):")
-    print(f"{'ID':<3} | {'Множ.':<8} | {'k':<3} | {'g(x)':<30} | {'h(x)':<30}")
-    print("-" * 90)
+    print(f"{'ID':<3} | {'Множ.':<8} | {'k':<3} | {'d':<3} | {'g(x)':<30} | {'h(x)':<30}")
+    print("-" * 96)
     for c in codes_list:
-        g_str = format_poly(c['g'], x)
-        h_str = format_poly(c['h'], x)
-        print(f"#{c['id']:<2} | {str(c['indices']):<8} | {c['k']:<3} | {g_str:<30} | {h_str:<30}")
+        g_str = format_poly(c['g'])
+        h_str = format_poly(c['h'])
+        d_str = str(c['d']) if c['d'] is not None else "-"
+        print(f"#{c['id']:<2} | {str(c['indices']):<8} | {c['k']:<3} | {d_str:<3} | {g_str:<30} | {h_str:<30}")
 
     print("\n4) Взаимоотношения:")
     print(f"{'Код':<4} | {'Двойственный (Dual)':<22} | {'Обратный (Recip)':<20}")
     print("-" * 60)
     
+    # Связи через перестановку множителей: номера хранятся в каталоге
     for c in codes_list:
-        h_recip = get_reciprocal_poly(c['h'], x, domain)
-        g_recip = get_reciprocal_poly(c['g'], x, domain)
-        
-        dual = next((item for item in codes_list if item['g'] == h_recip), None)
-        recip = next((item for item in codes_list if item['g'] == g_recip), None)
-        
-        dual_str = f"#{dual['id']}" if dual else "?"
-        recip_str = f"#{recip['id']}" if recip else "?"
-        
-        print(f"#{c['id']:<4} | {dual_str:<22} | {recip_str:<20}")
+        print(f"#{c['id']:<4} | {'#' + str(c['dual']):<22} | {'#' + str(c['recip']):<20}")
     
     print("   * Аннуляторный код совпадает с двойственным.")
 
 
     print("\n5-6) Матрицы для двух нетривиальных кодов (k=6):")
     
-    targets = [1, 2]
     selected = [c for c in codes_list if c['id'] in targets]
     
     for c in selected:
         print(f"\n" + "="*65)
         print(f" КОД #{c['id']} (k={c['k']})")
-        print(f" g(x) = {format_poly(c['g'], x)}")
+        print(f" g(x) = {format_poly(c['g'])}")
         print("="*65)
         
-       
-        G = get_cyclic_generator_matrix(c['g'], N, c['k'], P)
-        H = get_cyclic_parity_matrix(c['h'], N, N-c['k'], P)
+        # Матрицы -- целочисленные массивы над GF(P); систематическая форма
+        # строится по остаткам x^(n-k+i) mod g, первые k столбцов циклического
+        # кода всегда независимы (g(0) != 0)
+        mats = catalogue.matrices(c['id'])
+        G, H, G_sys, H_sys = mats['G'], mats['H'], mats['G_sys'], mats['H_sys']
         
         print("\n[5a] G (классическая):")
-        sympy.pprint(G)
+        print(format_matrix(G))
         print("\n[5b] H (классическая):")
-        sympy.pprint(H)
+        print(format_matrix(H))
         
         # Проверка
-        ortho = matrix_mod_p(G * H.T, P).is_zero_matrix
+        ortho = is_orthogonal(G, H, P)
         print(f"   -> Проверка G * H^T = 0: {'OK' if ortho else 'FAIL'}")
         
-        # Систематические
-        G_sys, H_sys = get_systematic_matrices(G, N, c['k'], P)
+        print("\n[6a] G_sys [I | P]:")
+        print(format_matrix(G_sys))
+        print("\n[6b] H_sys [-P^T | I]:")
+        print(format_matrix(H_sys))
         
-        if G_sys:
-            print("\n[6a] G_sys [I | P]:")
-            sympy.pprint(G_sys)
-            print("\n[6b] H_sys [-P^T | I]:")
-            sympy.pprint(H_sys)
-            
-            ortho_sys = matrix_mod_p(G_sys * H_sys.T, P).is_zero_matrix
-            print(f"   -> Проверка G_sys * H_sys^T = 0: {'OK' if ortho_sys else 'FAIL'}")
-        else:
-            print("\n[6] Невозможно получить вид [I | P] без перестановки столбцов (первые k столбцов зависимы).")
+        ortho_sys = is_orthogonal(G_sys, H_sys, P)
+        print(f"   -> Проверка G_sys * H_sys^T = 0: {'OK' if ortho_sys else 'FAIL'}")
 
 if __name__ == "__main__":
     solve()
\ No newline at end of file
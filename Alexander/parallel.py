@@ -0,0 +1,20 @@
+"""
+Общие помощники для пулов процессов пакетов cyclic и stego.
+
+Модуль лежит рядом с пакетами (как indiv*.py), поэтому импортируется
+как `from parallel import bounded` везде, где доступны cyclic и stego.
+"""
+from concurrent.futures import FIRST_COMPLETED, wait
+
+
+def bounded(pool, fn, tasks, window):
+    """Результаты fn(task) по мере готовности; в работе не больше window задач."""
+    pending = set()
+    for task in tasks:
+        pending.add(pool.submit(fn, task))
+        if len(pending) >= window:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                yield f.result()
+    for f in pending:
+        yield f.result()
@@ -0,0 +1,7 @@
+"""
+Быстрые алгоритмы LSB-стеганографии (к indiv1.ipynb).
+
+Изображения обрабатываются как массивы NumPy (np.asarray(img)), без обхода
+пикселей в Python.
+"""
+from .lsb import capacity, get_lsb_bits, lsb_plane, read_bits, set_lsb_bits, set_lsb_plane, write_bits
@@ -0,0 +1,242 @@
+"""
+Пакетный стегоанализ каталогов изображений в пуле процессов.
+
+Для каждого изображения считаются доли единиц LSB по каналам, тесты NIST
+(nist.BitTests) по младшей битовой плоскости и атака хи-квадрат по парам
+значений (Вестфельд -- Пфицманн). Результаты дописываются в хранилище
+(SQLite или CSV по расширению файла) с ключом SHA-256 содержимого файла:
+уже проанализированные изображения при повторном запуске пропускаются,
+а файлы, которые не удалось прочитать, анализируются заново.
+
+    python -m stego.batch images/ --store results.sqlite --workers 4
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from parallel import bounded
+
+from . import nist
+
+EXTENSIONS = (".png", ".bmp", ".tif", ".tiff", ".ppm", ".pgm", ".jpg", ".jpeg", ".webp")
+CHANNEL_NAMES = {1: ["L"], 3: ["R", "G", "B"], 4: ["R", "G", "B", "A"]}
+TESTS = ["frequency_p", "runs_p", "block_p", "serial_p1", "serial_p2", "apen_p",
+         "cusum_forward_p", "cusum_backward_p", "dft_p"]
+COLUMNS = ["sha256", "path", "width", "height", "mode", "bits", "proportion", "channels",
+           *TESTS, "chi_square", "chi_p", "status", "seconds"]
+ROWS = 512  # строк изображения в одном куске для тестов NIST
+
+
+def file_hash(path, block=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(block), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def find_images(root, extensions=EXTENSIONS):
+    """Пути всех изображений в дереве каталогов (по расширению), в стабильном порядке."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith(extensions):
+                yield os.path.join(dirpath, name)
+
+
+def lsb_statistics(arr):
+    """Доли единиц младших битов по каналам."""
+    arr = arr if arr.ndim == 3 else arr[:, :, None]
+    ones = np.count_nonzero(arr & 1, axis=(0, 1))
+    return (ones / (arr.shape[0] * arr.shape[1])).tolist()
+
+
+def chi_square_attack(arr):
+    """
+    Атака хи-квадрат по парам значений (2k, 2k + 1).
+    Встраивание в LSB выравнивает частоты внутри пар, поэтому p близко к 1
+    означает вероятное встраивание. Возвращает (статистика, p) по всем каналам вместе.
+    """
+    arr = arr if arr.ndim == 3 else arr[:, :, None]
+    hist = np.stack([np.bincount(arr[:, :, c].reshape(-1), minlength=256) for c in range(arr.shape[2])])
+    even, odd = hist[:, 0::2].reshape(-1), hist[:, 1::2].reshape(-1)
+    expected = (even + odd) / 2
+    keep = expected > 0
+    if keep.sum() < 2:
+        return 0.0, 0.0
+    chi = float(np.sum((even[keep] - expected[keep]) ** 2 / expected[keep]))
+    return chi, float(nist.igamc((keep.sum() - 1) / 2, chi / 2))
+
+
+def analyse_array(arr, rows=ROWS):
+    """Запись анализа для массива изображения (H, W) или (H, W, C)."""
+    tests = nist.BitTests()
+    for y in range(0, arr.shape[0], rows):
+        tests.update(arr[y:y + rows].reshape(-1) & 1)
+    result = tests.results()
+    channels = lsb_statistics(arr)
+    names = CHANNEL_NAMES.get(len(channels), [str(c) for c in range(len(channels))])
+    chi, chi_p = chi_square_attack(arr)
+    record = {
+        "width": arr.shape[1], "height": arr.shape[0], "bits": result["n"],
+        "proportion": result["proportion"], "channels": json.dumps(dict(zip(names, channels))),
+        "chi_square": chi, "chi_p": chi_p,
+    }
+    record.update({name: result[name] for name in TESTS})
+    return record
+
+
+def analyse_file(args):
+    """Задача пула: (путь, sha256) -> запись анализа."""
+    path, digest = args
+    start = time.perf_counter()
+    record = {"sha256": digest, "path": path}
+    try:
+        from PIL import Image
+        with Image.open(path) as img:
+            record["mode"] = img.mode
+            if img.mode not in ("L", "RGB", "RGBA"):
+                img = img.convert("RGB")
+            record.update(analyse_array(np.asarray(img)))
+        record["status"] = "ok"
+    except Exception as e:  # битые файлы не должны останавливать пакет
+        record["status"] = f"ошибка: {e}"
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+class SQLiteStore:
+    """
+    Таблица results с первичным ключом sha256. Запись с ошибкой заменяется
+    результатом повторной попытки, остальные только добавляются.
+    """
+
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        columns = ", ".join(f"{c} {'TEXT PRIMARY KEY' if c == 'sha256' else ''}" for c in COLUMNS)
+        self.db.execute(f"CREATE TABLE IF NOT EXISTS results ({columns})")
+
+    def keys(self):
+        """Ключи успешно проанализированных файлов."""
+        return {row[0] for row in self.db.execute("SELECT sha256 FROM results WHERE status = 'ok'")}
+
+    def add(self, record):
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        self.db.execute(f"INSERT OR REPLACE INTO results VALUES ({placeholders})",
+                        [record.get(c) for c in COLUMNS])
+        self.db.commit()
+
+    def records(self):
+        cursor = self.db.execute(f"SELECT {', '.join(COLUMNS)} FROM results")
+        return [dict(zip(COLUMNS, row)) for row in cursor]
+
+    def close(self):
+        self.db.close()
+
+
+class CSVStore:
+    """
+    Хранилище только на добавление: строки CSV с заголовком COLUMNS.
+    Повторная попытка дописывает новую строку; при чтении побеждает последняя.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "a", newline="", encoding="utf-8")
+        self.writer = csv.DictWriter(self.file, COLUMNS)
+        if new:
+            self.writer.writeheader()
+            self.file.flush()
+
+    def keys(self):
+        """Ключи успешно проанализированных файлов."""
+        return {row["sha256"] for row in self.records() if row["status"] == "ok"}
+
+    def add(self, record):
+        self.writer.writerow({c: record.get(c) for c in COLUMNS})
+        self.file.flush()
+
+    def records(self):
+        with open(self.path, newline="", encoding="utf-8") as f:
+            return list({row["sha256"]: row for row in csv.DictReader(f)}.values())
+
+    def close(self):
+        self.file.close()
+
+
+def open_store(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return CSVStore(path)
+    if ext in (".sqlite", ".sqlite3", ".db"):
+        return SQLiteStore(path)
+    raise ValueError(f"Неизвестный формат хранилища {path}: нужен .csv, .sqlite или .db")
+
+
+def analyse_directory(root, store_path, workers=None, extensions=EXTENSIONS):
+    """
+    Анализирует все новые изображения каталога root и дописывает их в хранилище.
+    Возвращает (новых, пропущено).
+    """
+    workers = workers or os.cpu_count() or 1
+    store = open_store(store_path)
+    try:
+        known = store.keys()
+        skipped = 0
+        tasks = []
+        for path in find_images(root, extensions):
+            digest = file_hash(path)
+            if digest in known:
+                skipped += 1
+                continue
+            known.add(digest)  # одинаковые файлы внутри одного запуска -- один раз
+            tasks.append((path, digest))
+        with ProcessPoolExecutor(workers) as pool:
+            for record in bounded(pool, analyse_file, tasks, 2 * workers):
+                store.add(record)
+    finally:
+        store.close()
+    return len(tasks), skipped
+
+
+def print_report(store_path, top=10):
+    """Изображения с наибольшим p атаки хи-квадрат (самые подозрительные)."""
+    store = open_store(store_path)
+    try:
+        records = [r for r in store.records() if r["status"] == "ok"]
+    finally:
+        store.close()
+    records.sort(key=lambda r: -float(r["chi_p"]))
+    print(f"{'p хи-квадрат':<13} | {'доля 1':<8} | {'freq p':<8} | {'runs p':<8} | файл")
+    print("-" * 70)
+    for r in records[:top]:
+        print(f"{float(r['chi_p']):<13.6f} | {float(r['proportion']):<8.5f} | "
+              f"{float(r['frequency_p']):<8.4f} | {float(r['runs_p']):<8.4f} | {r['path']}")
+    print(f"Всего в хранилище: {len(records)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетный стегоанализ LSB каталога изображений")
+    parser.add_argument("root", help="каталог с изображениями")
+    parser.add_argument("--store", default="stego_results.sqlite", help="файл .sqlite/.db или .csv")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=10, help="сколько подозрительных файлов показать")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    new, skipped = analyse_directory(args.root, args.store, args.workers)
+    print(f"Проанализировано: {new}, пропущено (уже в хранилище): {skipped}, "
+          f"{time.perf_counter() - start:.2f} с")
+    print_report(args.store, args.top)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
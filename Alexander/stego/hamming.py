@@ -0,0 +1,202 @@
+"""
+Матричное встраивание кодами Хэмминга (2^r - 1, r) сразу для всех блоков.
+
+Синдром блока x длины n = 2^r - 1 -- XOR номеров позиций (с 1), где x_i = 1,
+как в syndrom() из indiv1.ipynb. Для всех блоков он считается одним
+произведением (blocks x n) @ H^T по модулю 2 над упакованными в байты строками
+(таблица XOR на каждый байт), а все однобитовые исправления (позиция
+(s ^ m) - 1) применяются одним XOR по индексам.
+Биты сообщения группируются по r, старший бит первым (binvect_to_num).
+"""
+import functools
+
+import numpy as np
+
+from . import lsb
+
+MAX_R = 15          # r хранится в заголовке 4 битами
+HEADER_R = 3        # заголовок всегда встраивается кодом (7, 3)
+LENGTH_BITS = 32    # длина сообщения в битах
+
+
+def block_length(r):
+    return (1 << r) - 1
+
+
+def check_matrix(r):
+    """H (r x n): столбец i -- двоичная запись i + 1, старший бит в строке 0."""
+    if not 1 <= r <= MAX_R:
+        raise ValueError(f"r должно быть от 1 до {MAX_R}, получено {r}")
+    pos = np.arange(1, block_length(r) + 1)
+    return ((pos[None, :] >> np.arange(r - 1, -1, -1)[:, None]) & 1).astype(np.int32)
+
+
+def _weights(r):
+    return (1 << np.arange(r - 1, -1, -1)).astype(np.int64)
+
+
+@functools.lru_cache(maxsize=None)
+def _byte_syndromes(r):
+    """
+    Таблица (ceil(n / 8) x 256): XOR номеров позиций 8j + k + 1 единичных битов
+    байта j блока (k = 0 -- старший бит, как в np.packbits).
+    """
+    nbytes = -(-block_length(r) // 8)
+    table = np.zeros((nbytes, 256), dtype=np.int64)
+    byte_bits = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).astype(np.int64)
+    for k in range(8):
+        table ^= byte_bits[:, k][None, :] * (8 * np.arange(nbytes) + k + 1)[:, None]
+    table.setflags(write=False)
+    return table
+
+
+def syndromes(blocks, r):
+    """
+    Синдромы строк матрицы blocks (B x n) как целые числа 0..n: строки
+    упаковываются в байты, синдром -- XOR табличных значений байтов строки
+    (произведение на H^T по 8 столбцов за раз). Биты за концом блока в
+    последнем байте нулевые и вклада не дают.
+    """
+    packed = np.packbits(np.asarray(blocks, dtype=np.uint8), axis=1)
+    table = _byte_syndromes(r)
+    s = table[0][packed[:, 0]]
+    for j in range(1, packed.shape[1]):
+        s ^= table[j][packed[:, j]]
+    return s
+
+
+def pack_message(message_bits, r):
+    """Биты сообщения -> числа по r бит (последняя группа дополняется нулями)."""
+    bits = np.asarray(message_bits, dtype=np.uint8).reshape(-1)
+    pad = -len(bits) % r
+    if pad:
+        bits = np.concatenate((bits, np.zeros(pad, dtype=np.uint8)))
+    return bits.reshape(-1, r) @ _weights(r)
+
+
+def unpack_message(values, r):
+    """Числа по r бит -> вектор битов uint8."""
+    values = np.asarray(values, dtype=np.int64)
+    return ((values[:, None] >> np.arange(r - 1, -1, -1)) & 1).astype(np.uint8).reshape(-1)
+
+
+def embed(cover_bits, message_bits, r):
+    """
+    Биты контейнера, изменённые так, что синдромы первых блоков равны сообщению.
+    Меняется не больше одного бита на блок; возвращается копия только занятых блоков.
+    """
+    n = block_length(r)
+    values = pack_message(message_bits, r)
+    used = len(values) * n
+    cover_bits = np.asarray(cover_bits, dtype=np.uint8).reshape(-1)
+    if used > len(cover_bits):
+        raise ValueError(f"Нужно {used} битов контейнера, доступно {len(cover_bits)}")
+    blocks = cover_bits[:used].reshape(-1, n).copy()
+    flip = syndromes(blocks, r) ^ values
+    rows = np.nonzero(flip)[0]
+    blocks[rows, flip[rows] - 1] ^= 1
+    return blocks.reshape(-1)
+
+
+def extract(stego_bits, r, num_bits):
+    """Первые num_bits битов сообщения из синдромов блоков."""
+    n = block_length(r)
+    count = -(-num_bits // r)
+    blocks = np.asarray(stego_bits, dtype=np.uint8).reshape(-1)[:count * n].reshape(-1, n)
+    return unpack_message(syndromes(blocks, r), r)[:num_bits]
+
+
+def header_bits(r, num_bits):
+    """Заголовок: r (4 бита) и длина сообщения (32 бита)."""
+    return np.concatenate((unpack_message([r], 4), unpack_message([num_bits], LENGTH_BITS)))
+
+
+def parse_header(bits):
+    """(r, длина сообщения) из 4 + 32 битов заголовка."""
+    bits = np.asarray(bits, dtype=np.int64)
+    return int(bits[:4] @ _weights(4)), int(bits[4:4 + LENGTH_BITS] @ _weights(LENGTH_BITS))
+
+
+def header_cover_bits():
+    """Сколько битов контейнера занимает заголовок."""
+    return -(-(4 + LENGTH_BITS) // HEADER_R) * block_length(HEADER_R)
+
+
+def required_bits(num_bits, r):
+    """Битов контейнера на заголовок и сообщение длины num_bits при данном r."""
+    return header_cover_bits() + -(-num_bits // r) * block_length(r)
+
+
+def efficiency(r):
+    """Встроенных битов на одно изменение: r / (1 - 2^-r)."""
+    return r / (1 - 2.0 ** -r)
+
+
+def choose_r(num_bits, capacity):
+    """
+    Наибольшее r, при котором сообщение с заголовком помещается в capacity битов:
+    эффективность встраивания растёт с r, а доля использованных битов падает.
+    """
+    best = None
+    for r in range(1, MAX_R + 1):
+        if required_bits(num_bits, r) <= capacity:
+            best = r
+    if best is None:
+        raise ValueError(f"Сообщение из {num_bits} битов не помещается в {capacity} битов")
+    return best
+
+
+def embed_array(arr, message_bits, r=None, channels=None, bit=0):
+    """
+    Копия массива изображения с заголовком и сообщением.
+    r выбирается автоматически (choose_r), если не задан. Возвращает (массив, r).
+    """
+    message_bits = np.asarray(message_bits, dtype=np.uint8).reshape(-1)
+    num_bits = len(message_bits)
+    if num_bits >= 1 << LENGTH_BITS:
+        raise ValueError(f"Сообщение длиннее 2^{LENGTH_BITS} битов")
+    capacity = lsb.capacity(arr, channels)
+    r = choose_r(num_bits, capacity) if r is None else r
+    check_matrix(r)
+    if required_bits(num_bits, r) > capacity:
+        raise ValueError("Сообщение слишком длинное для данного изображения")
+    head = header_cover_bits()
+    cover = lsb.lsb_plane(arr, channels, bit, count=required_bits(num_bits, r))
+    stego = np.concatenate((embed(cover[:head], header_bits(r, num_bits), HEADER_R),
+                            embed(cover[head:], message_bits, r)))
+    return lsb.set_lsb_plane(arr, stego, channels, bit), r
+
+
+def extract_array(arr, channels=None, bit=0):
+    """Сообщение из массива изображения, записанного embed_array."""
+    head = header_cover_bits()
+    header = extract(lsb.lsb_plane(arr, channels, bit, count=head), HEADER_R, 4 + LENGTH_BITS)
+    r, num_bits = parse_header(header)
+    if not 1 <= r <= MAX_R or required_bits(num_bits, r) > lsb.capacity(arr, channels):
+        raise ValueError("Заголовок повреждён или сообщение не встроено")
+    stego = lsb.lsb_plane(arr, channels, bit, count=required_bits(num_bits, r))
+    return extract(stego[head:], r, num_bits)
+
+
+def benchmark_embedding(size=(1024, 1024, 3), payload=0.1, seed=0):
+    """Время встраивания/извлечения и доля изменённых битов для случайного контейнера."""
+    import time
+    rng = np.random.default_rng(seed)
+    arr = rng.integers(0, 256, size, dtype=np.uint8)
+    message = rng.integers(0, 2, int(lsb.capacity(arr) * payload), dtype=np.uint8)
+    start = time.perf_counter()
+    stego, r = embed_array(arr, message)
+    t_embed = time.perf_counter() - start
+    start = time.perf_counter()
+    ok = np.array_equal(extract_array(stego), message)
+    t_extract = time.perf_counter() - start
+    changes = int(np.count_nonzero((arr ^ stego) & 1))
+    print(f"{size}, полезная нагрузка {payload:.0%}: r = {r}, битов {len(message)}, изменений {changes}")
+    print(f"  битов на изменение: {len(message) / max(changes, 1):.3f} (теория {efficiency(r):.3f})")
+    print(f"  встраивание {t_embed:.3f} с, извлечение {t_extract:.3f} с, совпадение: {ok}")
+    return t_embed, t_extract
+
+
+if __name__ == "__main__":
+    for payload in (0.01, 0.1, 0.3):
+        benchmark_embedding(payload=payload)
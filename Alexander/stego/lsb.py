@@ -0,0 +1,94 @@
+"""
+Битовые плоскости изображений на массивах NumPy.
+
+Поток битов идёт в порядке пикселей, внутри пикселя -- по выбранным каналам,
+как в исходных get_lsb_bits/set_lsb_bits на list(img.getdata()).
+Логический номер бита i соответствует пикселю i // C' и каналу channels[i % C'],
+где C' -- число выбранных каналов.
+"""
+import numpy as np
+
+
+def _layout(arr, channels):
+    """(число каналов массива, номера выбранных каналов)."""
+    C = 1 if arr.ndim == 2 else arr.shape[2]
+    chans = np.arange(C) if channels is None else np.asarray(channels, dtype=np.intp).reshape(-1)
+    if len(chans) == 0 or chans.min() < 0 or chans.max() >= C:
+        raise ValueError(f"Недопустимые каналы {channels} для изображения с {C} каналами")
+    return C, chans
+
+
+def capacity(arr, channels=None):
+    """Сколько битов помещается в одну битовую плоскость выбранных каналов."""
+    arr = np.asarray(arr)
+    _, chans = _layout(arr, channels)
+    return arr.shape[0] * arr.shape[1] * len(chans)
+
+
+def physical_index(idx, arr, channels=None):
+    """Логические номера битов -> номера элементов в arr.reshape(-1)."""
+    C, chans = _layout(arr, channels)
+    idx = np.asarray(idx, dtype=np.int64)
+    if channels is None:
+        return idx
+    return (idx // len(chans)) * C + chans[idx % len(chans)]
+
+
+def read_bits(arr, idx, channels=None, bit=0):
+    """Биты плоскости bit в логических позициях idx (uint8)."""
+    arr = np.asarray(arr)
+    flat = arr.reshape(-1)
+    return ((flat[physical_index(idx, arr, channels)] >> bit) & 1).astype(np.uint8)
+
+
+def write_bits(arr, idx, bits, channels=None, bit=0):
+    """Записывает биты в логические позиции idx на месте (arr -- C-непрерывный массив)."""
+    if not arr.flags.c_contiguous or not arr.flags.writeable:
+        raise ValueError("Запись возможна только в непрерывный изменяемый массив")
+    flat = arr.reshape(-1)
+    pos = physical_index(idx, arr, channels)
+    mask = arr.dtype.type(1 << bit)
+    bits = np.asarray(bits, dtype=arr.dtype).reshape(-1)
+    flat[pos] = (flat[pos] & ~mask) | (bits << bit)
+    return arr
+
+
+def lsb_plane(arr, channels=None, bit=0, count=None):
+    """
+    Битовая плоскость bit (по умолчанию младшая) одним вектором uint8.
+    count ограничивает чтение первыми count битами -- остальное не трогается.
+    """
+    arr = np.asarray(arr)
+    total = capacity(arr, channels)
+    count = total if count is None else min(count, total)
+    if channels is None:
+        return ((arr.reshape(-1)[:count] >> bit) & 1).astype(np.uint8)
+    return read_bits(arr, np.arange(count), channels, bit)
+
+
+def set_lsb_plane(arr, bits, channels=None, bit=0):
+    """
+    Копия arr, в которой первые len(bits) битов плоскости bit заменены на bits:
+    arr & ~mask | bits. Если bits короче плоскости, остальные значения не меняются.
+    """
+    res = np.array(arr, copy=True, order='C')
+    bits = np.asarray(bits, dtype=res.dtype).reshape(-1)
+    if len(bits) > capacity(res, channels):
+        raise ValueError(f"Битов {len(bits)} больше ёмкости плоскости {capacity(res, channels)}")
+    if channels is None:
+        flat = res.reshape(-1)
+        mask = res.dtype.type(1 << bit)
+        flat[:len(bits)] = (flat[:len(bits)] & ~mask) | (bits << bit)
+        return res
+    return write_bits(res, np.arange(len(bits)), bits, channels, bit)
+
+
+def get_lsb_bits(img, channels=None, bit=0):
+    """Младшие биты изображения PIL (оттенки серого или RGB) без обхода пикселей."""
+    return lsb_plane(np.asarray(img), channels, bit)
+
+
+def set_lsb_bits(img, bits, channels=None, bit=0):
+    """Новое изображение PIL с заменёнными битами плоскости bit."""
+    from PIL import Image
+    return Image.fromarray(set_lsb_plane(np.asarray(img), bits, channels, bit))
@@ -0,0 +1,155 @@
+"""
+Метрики искажения контейнер/стего на массивах NumPy.
+
+Distortion накапливает по полосам строк: число изменённых LSB по каналам,
+гистограмму числа изменений на пиксель, MSE/PSNR и SSIM (окно win x win
+с равными весами, только целиком лежащие в изображении окна, ковариации
+с поправкой N/(N-1) -- как skimage.metrics.structural_similarity с
+gaussian_weights=False). Для SSIM последние win - 1 строк полосы
+сохраняются, поэтому результат не зависит от высоты полос.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import tiles
+
+WIN = 7
+ROWS = 256
+C1 = (0.01 * 255) ** 2
+C2 = (0.03 * 255) ** 2
+
+
+def _window_sums(a, win):
+    """Суммы по всем окнам win x win целиком внутри a (интегральное изображение)."""
+    s = np.zeros((a.shape[0] + 1, a.shape[1] + 1) + a.shape[2:], dtype=np.float64)
+    s[1:, 1:] = a.cumsum(axis=0).cumsum(axis=1)
+    return s[win:, win:] - s[:-win, win:] - s[win:, :-win] + s[:-win, :-win]
+
+
+def ssim_map(x, y, win=WIN):
+    """Карта SSIM для окон win x win (массивы (H, W) или (H, W, C))."""
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    N = win * win
+    mx, my = _window_sums(x, win) / N, _window_sums(y, win) / N
+    norm = N / (N - 1)
+    vx = (_window_sums(x * x, win) / N - mx * mx) * norm
+    vy = (_window_sums(y * y, win) / N - my * my) * norm
+    cxy = (_window_sums(x * y, win) / N - mx * my) * norm
+    return ((2 * mx * my + C1) * (2 * cxy + C2)) / ((mx * mx + my * my + C1) * (vx + vy + C2))
+
+
+class Distortion:
+    """Накопитель метрик по полосам строк пары изображений одинаковой формы."""
+
+    def __init__(self, win=WIN):
+        self.win = win
+        self.channels = None
+        self.pixels = 0
+        self.sq_error = 0.0
+        self.max_diff = 0
+        self.ssim_sum = 0.0
+        self.ssim_count = 0
+        self.carry = None  # последние win - 1 строк (контейнер, стего)
+
+    def update(self, cover, stego):
+        cover = np.asarray(cover)
+        stego = np.asarray(stego)
+        if cover.shape != stego.shape:
+            raise ValueError(f"Разные размеры полос: {cover.shape} и {stego.shape}")
+        cover = cover if cover.ndim == 3 else cover[:, :, None]
+        stego = stego if stego.ndim == 3 else stego[:, :, None]
+        if self.channels is None:
+            self.channels = cover.shape[2]
+            self.channel_changes = np.zeros(self.channels, dtype=np.int64)
+            self.per_pixel = np.zeros(self.channels + 1, dtype=np.int64)
+        changed = ((cover ^ stego) & 1).astype(bool)
+        self.channel_changes += np.count_nonzero(changed, axis=(0, 1))
+        self.per_pixel += np.bincount(changed.sum(axis=2).reshape(-1), minlength=self.channels + 1)
+        diff = cover.astype(np.int64) - stego.astype(np.int64)
+        self.sq_error += float(np.sum(diff * diff))
+        if diff.size:
+            self.max_diff = max(self.max_diff, int(np.abs(diff).max()))
+        self.pixels += cover.shape[0] * cover.shape[1]
+        if self.carry is not None:
+            cover = np.concatenate((self.carry[0], cover))
+            stego = np.concatenate((self.carry[1], stego))
+        if cover.shape[0] >= self.win and cover.shape[1] >= self.win:
+            m = ssim_map(cover, stego, self.win)
+            self.ssim_sum += float(m.mean(axis=2).sum())
+            self.ssim_count += m.shape[0] * m.shape[1]
+        keep = self.win - 1
+        self.carry = (cover[-keep:], stego[-keep:])
+        return self
+
+    def results(self, message_bits=None):
+        channel_changes = self.channel_changes.tolist() if self.channels else []
+        changed = sum(channel_changes)
+        total_bits = self.pixels * (self.channels or 0)
+        mse = self.sq_error / total_bits if total_bits else 0.0
+        result = {
+            'total_bits': total_bits,
+            'pixels': self.pixels,
+            'changed_bits': changed,
+            'change_percentage': changed / total_bits * 100 if total_bits else 0.0,
+            'channel_changes': channel_changes,
+            'changes_per_pixel': self.per_pixel.tolist() if self.channels else [],
+            'pixels_with_changes': self.pixels - int(self.per_pixel[0]) if self.channels else 0,
+            'max_abs_diff': self.max_diff,
+            'mse': mse,
+            'psnr': 10 * math.log10(255 ** 2 / mse) if mse > 0 else float('inf'),
+            'ssim': self.ssim_sum / self.ssim_count if self.ssim_count else 1.0,
+        }
+        # без длины сообщения (None или 0) эффективность не определена: nan
+        if message_bits:
+            result['efficiency'] = changed / message_bits if changed else float('inf')
+            result['bits_per_change'] = message_bits / changed if changed else 0.0
+        else:
+            result['efficiency'] = result['bits_per_change'] = float('nan')
+        return result
+
+
+def compare_arrays(cover, stego, message_bits=None, rows=ROWS, win=WIN):
+    """Метрики для пары массивов, обработанных полосами по rows строк."""
+    acc = Distortion(win)
+    for y in range(0, cover.shape[0], rows):
+        acc.update(cover[y:y + rows], stego[y:y + rows])
+    return acc.results(message_bits)
+
+
+def compare_files(cover_path, stego_path, message_bits=None, rows=ROWS, win=WIN):
+    """
+    Метрики для пары файлов; PPM/PGM, .npy и несжатый TIFF читаются полосами
+    (tiles.open_image), остальные форматы декодируются целиком.
+    """
+    cover, stego = tiles.open_image(cover_path), tiles.open_image(stego_path)
+    if cover.shape != stego.shape:
+        raise ValueError(f"Изображения разного размера: {cover.shape} и {stego.shape}")
+    acc = Distortion(win)
+    for y in range(0, cover.shape[0], rows):
+        acc.update(np.asarray(cover[y:y + rows]), np.asarray(stego[y:y + rows]))
+    return acc.results(message_bits)
+
+
+def _compare_task(args):
+    cover_path, stego_path, message_bits = args
+    try:
+        return compare_files(cover_path, stego_path, message_bits)
+    except (OSError, ValueError) as e:
+        return {'error': str(e)}
+
+
+def compare_batch(pairs, message_bits=None, workers=None):
+    """
+    Метрики для списка пар (контейнер, стего) в пуле процессов.
+    message_bits -- одно число для всех пар или список по парам.
+    """
+    pairs = list(pairs)
+    if not isinstance(message_bits, (list, tuple)):
+        message_bits = [message_bits] * len(pairs)
+    tasks = [(c, s, m) for (c, s), m in zip(pairs, message_bits)]
+    with ProcessPoolExecutor(workers or os.cpu_count() or 1) as pool:
+        return list(pool.map(_compare_task, tasks))
@@ -0,0 +1,279 @@
+"""
+Статистические тесты NIST SP 800-22 над массивами битов за один проход.
+
+BitTests накапливает статистики по кускам потока (update), поэтому битовую
+плоскость большого изображения можно проверять, не держа её в памяти целиком;
+results() возвращает p-value всех тестов сразу:
+
+  frequency, runs, block frequency -- те же формулы, что у StatisticalTests
+      из indiv1.ipynb (включая дисперсию серий и предусловие |pi - 1/2| < 2/sqrt(n));
+  serial, approximate entropy -- частоты перекрывающихся шаблонов с
+      циклическим продолжением (начало потока хранится для хвоста);
+  cumulative sums -- вперёд и назад по минимуму/максимуму частичных сумм;
+  DFT -- спектральный тест по блокам dft_block битов, отклонения числа пиков
+      суммируются по блокам (полное БПФ всего потока потребовало бы всех битов сразу).
+"""
+import math
+
+import numpy as np
+
+try:
+    from scipy.special import gammaincc as igamc
+except ImportError:
+    def igamc(a, x):
+        """Регуляризованная верхняя неполная гамма-функция Q(a, x)."""
+        if x <= 0:
+            return 1.0
+        log_front = -x + a * math.log(x) - math.lgamma(a)
+        if x < a + 1:
+            term = total = 1.0 / a
+            ap = a
+            for _ in range(1000000):
+                ap += 1
+                term *= x / ap
+                total += term
+                if abs(term) < abs(total) * 1e-15:
+                    break
+            return max(0.0, 1.0 - total * math.exp(log_front))
+        tiny = 1e-300
+        b = x + 1 - a
+        c, d = 1 / tiny, 1 / b
+        h = d
+        for i in range(1, 1000000):
+            an = -i * (i - a)
+            b += 2
+            d = an * d + b
+            d = tiny if abs(d) < tiny else d
+            c = b + an / c
+            c = tiny if abs(c) < tiny else c
+            d = 1 / d
+            h *= d * c
+            if abs(d * c - 1) < 1e-15:
+                break
+        return math.exp(log_front) * h
+
+CHUNK = 1 << 22  # битов в одном куске для run_tests
+
+
+def _phi(x):
+    return 0.5 * math.erfc(-x / math.sqrt(2))
+
+
+def _window_codes(seq, length):
+    """Коды всех окон длины length подряд идущих битов (старший бит первым)."""
+    count = len(seq) - length + 1
+    codes = np.zeros(max(count, 0), dtype=np.int64)
+    for t in range(length):
+        codes = (codes << 1) | seq[t:t + count]
+    return codes
+
+
+class BitTests:
+    """Накопитель статистик тестов NIST по кускам битового потока."""
+
+    def __init__(self, M=128, serial_m=3, apen_m=2, dft_block=1 << 16):
+        if M < 1 or serial_m < 2 or apen_m < 1 or dft_block < 8:
+            raise ValueError(f"Недопустимые параметры: M={M}, serial_m={serial_m}, "
+                             f"apen_m={apen_m}, dft_block={dft_block}")
+        self.M, self.serial_m, self.apen_m, self.dft_block = M, serial_m, apen_m, dft_block
+        self.lengths = sorted({serial_m, serial_m - 1, serial_m - 2, apen_m, apen_m + 1} - {0})
+        self.span = max(self.lengths) - 1
+        self.counts = {L: np.zeros(1 << L, dtype=np.int64) for L in self.lengths}
+        self.n = 0
+        self.ones = 0
+        self.transitions = 0
+        self.last = None
+        self.head = np.zeros(0, dtype=np.uint8)   # первые span битов (для циклического продолжения)
+        self.tail = np.zeros(0, dtype=np.uint8)   # последние span битов
+        self.block_carry = np.zeros(0, dtype=np.uint8)
+        self.blocks = 0
+        self.block_chi = 0.0
+        self.walk = 0                              # частичная сумма S_k (+1 / -1)
+        self.walk_max = self.walk_min = 0          # max/min S_j по j = 0..n-1
+        self.walk_abs = 0                          # max |S_k| по k = 1..n
+        self.dft_carry = np.zeros(0, dtype=np.uint8)
+        self.dft_observed = 0.0
+        self.dft_expected = 0.0
+        self.dft_variance = 0.0
+
+    def update(self, bits):
+        """Добавляет кусок битов (массив 0/1 любого целого типа или список)."""
+        bits = np.asarray(bits, dtype=np.uint8).reshape(-1)
+        if not len(bits):
+            return self
+        # frequency и runs
+        self.ones += int(np.count_nonzero(bits))
+        self.transitions += int(np.count_nonzero(bits[1:] != bits[:-1]))
+        if self.last is not None and self.last != bits[0]:
+            self.transitions += 1
+        self.last = bits[-1]
+        # block frequency
+        seq = np.concatenate((self.block_carry, bits))
+        full = len(seq) // self.M * self.M
+        if full:
+            pi = seq[:full].reshape(-1, self.M).sum(axis=1, dtype=np.int64) / self.M
+            self.block_chi += float(np.sum((pi - 0.5) ** 2))
+            self.blocks += full // self.M
+        self.block_carry = seq[full:]
+        # serial и approximate entropy: окна, оканчивающиеся в новом куске
+        seq = np.concatenate((self.tail, bits))
+        for L in self.lengths:
+            first = max(len(self.tail) - L + 1, 0)
+            codes = _window_codes(seq[first:], L)
+            self.counts[L] += np.bincount(codes, minlength=1 << L)
+        if len(self.head) < self.span:
+            self.head = np.concatenate((self.head, bits[:self.span - len(self.head)]))
+        self.tail = seq[-self.span:]
+        # cumulative sums
+        walk = self.walk + np.cumsum(2 * bits.astype(np.int64) - 1)
+        before = np.concatenate(([self.walk], walk[:-1]))
+        self.walk_max = max(self.walk_max, int(before.max()))
+        self.walk_min = min(self.walk_min, int(before.min()))
+        self.walk_abs = max(self.walk_abs, int(np.abs(walk).max()))
+        self.walk = int(walk[-1])
+        # DFT по блокам
+        seq = np.concatenate((self.dft_carry, bits))
+        full = len(seq) // self.dft_block * self.dft_block
+        if full:
+            self._dft_blocks(seq[:full].reshape(-1, self.dft_block))
+        self.dft_carry = seq[full:]
+        self.n += len(bits)
+        return self
+
+    def update_packed(self, packed, count=None):
+        """Кусок в упакованном виде (np.packbits), count -- число значащих битов."""
+        return self.update(np.unpackbits(np.asarray(packed, dtype=np.uint8), count=count))
+
+    def _dft_blocks(self, blocks):
+        B = blocks.shape[1]
+        moduli = np.abs(np.fft.rfft(2.0 * blocks - 1.0, axis=1))[:, :B // 2]
+        threshold = math.sqrt(math.log(1 / 0.05) * B)
+        self.dft_observed += float(np.count_nonzero(moduli < threshold))
+        self.dft_expected += 0.95 * B / 2 * len(blocks)
+        self.dft_variance += B * 0.95 * 0.05 / 4 * len(blocks)
+
+    def _psi2(self, L):
+        if L == 0:
+            return 0.0
+        nu = self.counts[L] + self._wrap_counts(L)
+        return float((1 << L) / self.n * np.sum(nu.astype(np.float64) ** 2) - self.n)
+
+    def _phi_m(self, L):
+        if L == 0:
+            return 0.0
+        c = (self.counts[L] + self._wrap_counts(L)) / self.n
+        c = c[c > 0]
+        return float(np.sum(c * np.log(c)))
+
+    def _wrap_counts(self, L):
+        """Окна, переходящие через конец потока на его начало."""
+        ext = np.concatenate((self.tail[len(self.tail) - (L - 1):] if L > 1 else self.tail[:0], self.head[:L - 1]))
+        return np.bincount(_window_codes(ext, L), minlength=1 << L)
+
+    def frequency_p(self):
+        if self.n == 0:
+            return 0.0
+        s_obs = abs(2 * self.ones - self.n) / math.sqrt(self.n)
+        return math.erfc(s_obs / math.sqrt(2))
+
+    def runs_p(self):
+        n = self.n
+        if n == 0:
+            return 0.0
+        pi = self.ones / n
+        if abs(pi - 0.5) >= 2 / math.sqrt(n):
+            return 0.0
+        runs = self.transitions + 1
+        expected = 2 * n * pi * (1 - pi)
+        variance = 2 * n * pi * (1 - pi) * (1 - 2 * pi * (1 - pi))
+        if variance <= 0:
+            return 0.0
+        z = (runs - expected) / math.sqrt(variance)
+        return math.erfc(abs(z) / math.sqrt(2))
+
+    def block_frequency(self):
+        """(p-value, chi-square); блоки по M битов, неполный последний блок не учитывается."""
+        if self.blocks == 0:
+            return 0.0, 0.0
+        chi_square = 4 * self.M * self.block_chi
+        return float(igamc(self.blocks / 2, chi_square / 2)), chi_square
+
+    def serial_p(self):
+        """(p1, p2) последовательного теста для шаблонов длины serial_m."""
+        m = self.serial_m
+        if self.n <= self.span:
+            return 0.0, 0.0
+        psi_m, psi_m1, psi_m2 = self._psi2(m), self._psi2(m - 1), self._psi2(m - 2)
+        d1 = psi_m - psi_m1
+        d2 = psi_m - 2 * psi_m1 + psi_m2
+        return float(igamc(2 ** (m - 2), d1 / 2)), float(igamc(2 ** (m - 3), d2 / 2))
+
+    def apen_p(self):
+        m = self.apen_m
+        if self.n <= self.span:
+            return 0.0
+        apen = self._phi_m(m) - self._phi_m(m + 1)
+        chi_square = 2 * self.n * (math.log(2) - apen)
+        return float(igamc(2 ** (m - 1), chi_square / 2))
+
+    def _cusum(self, z):
+        n = self.n
+        if z == 0:
+            return 1.0
+        sq = math.sqrt(n)
+        total = 1.0
+        # границы суммирования усекаются к нулю, как в эталонной реализации NIST
+        for k in range(int((-n / z + 1) / 4), int((n / z - 1) / 4) + 1):
+            total -= _phi((4 * k + 1) * z / sq) - _phi((4 * k - 1) * z / sq)
+        for k in range(int((-n / z - 3) / 4), int((n / z - 1) / 4) + 1):
+            total += _phi((4 * k + 3) * z / sq) - _phi((4 * k + 1) * z / sq)
+        return min(max(total, 0.0), 1.0)
+
+    def cusum_p(self):
+        """(p вперёд, p назад) теста кумулятивных сумм."""
+        if self.n == 0:
+            return 0.0, 0.0
+        backward = max(self.walk - self.walk_min, self.walk_max - self.walk)
+        return self._cusum(self.walk_abs), self._cusum(backward)
+
+    def dft_p(self, min_tail=1000):
+        """p-value спектрального теста; хвост короче блока учитывается, если в нём >= min_tail битов."""
+        observed, expected, variance = self.dft_observed, self.dft_expected, self.dft_variance
+        tail = len(self.dft_carry)
+        if tail >= min_tail or (variance == 0 and tail >= 8):
+            saved = observed, expected, variance
+            self._dft_blocks(self.dft_carry[None, :])
+            observed, expected, variance = self.dft_observed, self.dft_expected, self.dft_variance
+            self.dft_observed, self.dft_expected, self.dft_variance = saved
+        if variance == 0:
+            return 0.0
+        d = (observed - expected) / math.sqrt(variance)
+        return math.erfc(abs(d) / math.sqrt(2))
+
+    def results(self):
+        p_block, chi_square = self.block_frequency()
+        serial_p1, serial_p2 = self.serial_p()
+        cusum_forward, cusum_backward = self.cusum_p()
+        return {
+            'n': self.n,
+            'proportion': self.ones / self.n if self.n else 0.0,
+            'frequency_p': self.frequency_p(),
+            'runs_p': self.runs_p(),
+            'block_p': p_block,
+            'chi_square': chi_square,
+            'serial_p1': serial_p1,
+            'serial_p2': serial_p2,
+            'apen_p': self.apen_p(),
+            'cusum_forward_p': cusum_forward,
+            'cusum_backward_p': cusum_backward,
+            'dft_p': self.dft_p(),
+        }
+
+
+def run_tests(bits, chunk=CHUNK, **params):
+    """Все тесты для массива битов, обработанного кусками по chunk битов."""
+    tests = BitTests(**params)
+    bits = np.asarray(bits).reshape(-1)
+    for start in range(0, len(bits), chunk):
+        tests.update(bits[start:start + chunk])
+    return tests.results()
@@ -0,0 +1,74 @@
+"""
+Ключевая псевдослучайная перестановка номеров битов без хранения списка индексов.
+
+Сеть Фейстеля на 2b битах (2^(2b) >= size) с циклическим обходом (cycle walking):
+значения вне [0, size) шифруются повторно, пока не попадут в диапазон.
+Номер любой логической позиции вычисляется за O(1), для массива позиций --
+векторно. Ключи раундов выводятся из seed через np.random.SeedSequence,
+глобальное состояние random/np.random не используется.
+"""
+import numpy as np
+
+ROUNDS = 6
+_M1 = np.uint64(0xBF58476D1CE4E5B9)
+_M2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix(x):
+    """Финализатор splitmix64 (uint64, переполнение -- по модулю 2^64)."""
+    x = x ^ (x >> np.uint64(30))
+    x = x * _M1
+    x = x ^ (x >> np.uint64(27))
+    x = x * _M2
+    return x ^ (x >> np.uint64(31))
+
+
+class KeyedPermutation:
+    """Биекция [0, size) -> [0, size), заданная ключом seed."""
+
+    def __init__(self, size, seed, rounds=ROUNDS):
+        if size < 1:
+            raise ValueError(f"Размер перестановки должен быть положительным, получено {size}")
+        self.size = int(size)
+        self.half = max(1, (int(size - 1).bit_length() + 1) // 2)
+        self.mask = np.uint64((1 << self.half) - 1)
+        self.keys = np.random.SeedSequence(seed).generate_state(rounds, dtype=np.uint64)
+
+    def _encrypt(self, x):
+        shift = np.uint64(self.half)
+        left, right = x >> shift, x & self.mask
+        for key in self.keys:
+            left, right = right, left ^ (_mix(right ^ key) & self.mask)
+        return (left << shift) | right
+
+    def _decrypt(self, x):
+        shift = np.uint64(self.half)
+        left, right = x >> shift, x & self.mask
+        for key in self.keys[::-1]:
+            left, right = right ^ (_mix(left ^ key) & self.mask), left
+        return (left << shift) | right
+
+    def _walk(self, idx, step):
+        scalar = np.ndim(idx) == 0
+        idx = np.array(idx, dtype=np.int64, ndmin=1)
+        if idx.size and (idx.min() < 0 or idx.max() >= self.size):
+            raise ValueError(f"Номера позиций должны быть в [0, {self.size})")
+        x = idx.astype(np.uint64)
+        out = step(x)
+        bad = np.nonzero(out >= self.size)[0]
+        while len(bad):
+            out[bad] = step(out[bad])
+            bad = bad[out[bad] >= self.size]
+        out = out.astype(np.int64)
+        return int(out[0]) if scalar else out
+
+    def __call__(self, idx):
+        """Логические позиции -> физические номера битов (число или массив)."""
+        return self._walk(idx, self._encrypt)
+
+    def inverse(self, idx):
+        """Физические номера битов -> логические позиции."""
+        return self._walk(idx, self._decrypt)
+
+    def __len__(self):
+        return self.size
@@ -0,0 +1,470 @@
+"""
+Syndrome-trellis codes (STC): встраивание с минимальной суммарной стоимостью изменений.
+
+Проверочная матрица H составлена из подматриц H^ (h x w), сдвигаемых на одну
+строку вниз на каждый бит сообщения (Filler, Judas, Fridrich, 2011); стего-биты y
+выбираются так, что H y = m, а сумма стоимостей изменённых позиций минимальна.
+Витерби идёт по 2^h состояниям решётки.
+
+Сообщение делится на S независимых отрезков по L = ceil(num_bits / S) <= SEGMENT
+битов, последний отрезок -- остаток сообщения. Из N = min(доступно, MAX_W * num_bits)
+битов контейнера каждый отрезок получает n = N * L // num_bits, последний -- всё
+оставшееся (не больше MAX_W на бит), поэтому встраивается любое сообщение не
+длиннее контейнера. Блоки отрезка получают по w0 = n // L или w0 + 1 битов, так
+что остаток ёмкости не пропадает (дробная обратная скорость). Подматрица для
+каждой пары (h, w) -- лучшая из CANDIDATES случайных по числу изменений на случайном контейнере
+(таблица SEEDS, воспроизводится функцией search_seeds). Разбиение однозначно
+определяется длиной сообщения и доступной ёмкостью, поэтому извлечению нужна
+только та же высота h.
+
+Выбор на каждом шаге решётки хранится по биту на состояние: n * 2^h / 8 байтов
+на отрезок (при SEGMENT = 1024, MAX_W = 32 и h = MAX_H -- 16 МБ). С numba
+отрезки проходятся по одному скомпилированной функцией; без неё -- пачками
+отрезков на NumPy так, чтобы таблица выборов занимала не больше PATH_BYTES.
+Время -- O(n * 2^h) на отрезок в обоих случаях.
+
+Формат в изображении -- как у hamming.embed_array: заголовок кодом (7, 3)
+с полем r = 0 (признак STC) и длиной сообщения, затем биты STC.
+
+Высоту для embed_array по умолчанию выбирает choose_height по доле нагрузки
+alpha = num_bits / ёмкость (битов сообщения на изменение, benchmark_stc на
+случайном контейнере 256 x 256 x 3; Хэмминг -- с автоматическим r):
+
+    alpha   Хэмминг  h=7    h=10   h=12
+    0.015   8.80     6.92   7.80   8.17
+    0.03    7.91     7.06   7.93   8.26
+    0.05    7.00     6.91   7.44   7.69
+    0.0625  6.08     6.59   7.16   7.42
+    0.10    5.14     6.11   6.63   6.80
+    0.25    4.26     5.03   5.33   5.48
+
+При alpha >= 1/16 берётся h = H = 7, при 1/32 <= alpha < 1/16 -- h = 10 (h = 7
+там уступает Хэммингу, а h = 10 примерно в 8 раз медленнее h = 7). Ниже
+1/MAX_W STC не может использовать весь контейнер: h = 10 лишь догоняет
+Хэмминга, h = 12 выигрывает 4% при 0.03 ценой скорости в сотни раз ниже и
+проигрывает при 0.015. Поэтому там сообщение встраивается hamming.embed_array;
+extract_array различает способ по полю r заголовка.
+
+    python -m stego.stc          # сравнение с Хэммингом по нагрузкам и высотам
+"""
+import time
+
+import numpy as np
+
+from . import hamming, lsb
+
+try:
+    import numba
+except ImportError:  # без numba работает тот же Витерби на NumPy
+    numba = None
+
+H = 7               # высота ограничения для нагрузки от 1/16
+LOW_RATE_H = 10     # высота для нагрузки от 1/MAX_W до 1/16
+MAX_H = 12          # проверенный диапазон высот 1..MAX_H
+SEGMENT = 1024      # наибольшее число битов сообщения в одном отрезке
+MAX_W = 32          # наибольшая обратная скорость (битов контейнера на бит сообщения)
+STC_MARK = 0        # значение поля r в заголовке для STC
+PATH_BYTES = 1 << 26  # предел таблицы выборов для пачки отрезков без numba
+CANDIDATES = 32     # подматриц-кандидатов на каждую пару (h, w) в search_seeds
+
+# SEEDS[h][w - 1] -- номер лучшей подматрицы-кандидата для (h, w), найден search_seeds();
+# при h <= 2 все кандидаты совпадают
+SEEDS = {
+    1: (0,) * MAX_W,
+    2: (0,) * MAX_W,
+    3: (0, 3, 0, 3, 30, 8, 18, 14, 24, 2, 16, 27, 23, 6, 20, 20,
+         20, 9, 3, 20, 5, 6, 14, 16, 16, 29, 21, 25, 26, 8, 8, 15),
+    4: (7, 7, 10, 22, 24, 2, 10, 22, 30, 7, 17, 15, 19, 13, 7, 14,
+         30, 7, 8, 23, 31, 1, 1, 17, 23, 8, 2, 14, 11, 22, 15, 17),
+    5: (3, 6, 20, 5, 13, 13, 20, 20, 6, 26, 13, 24, 31, 25, 29, 30,
+         14, 2, 17, 3, 6, 3, 10, 11, 19, 12, 14, 31, 6, 0, 4, 29),
+    6: (25, 9, 18, 17, 24, 27, 16, 7, 21, 19, 25, 31, 22, 29, 2, 23,
+         5, 29, 7, 6, 26, 2, 5, 15, 19, 14, 31, 24, 26, 23, 9, 28),
+    7: (5, 22, 7, 11, 1, 27, 4, 2, 20, 22, 0, 3, 22, 27, 22, 18,
+         25, 9, 23, 8, 18, 27, 30, 19, 10, 21, 20, 6, 22, 17, 6, 22),
+    8: (6, 21, 26, 1, 10, 6, 28, 4, 14, 26, 19, 23, 16, 13, 3, 26,
+         8, 30, 23, 15, 18, 28, 23, 11, 10, 24, 1, 7, 15, 18, 9, 15),
+    9: (30, 5, 27, 29, 4, 8, 21, 2, 11, 2, 7, 11, 12, 19, 11, 25,
+         14, 9, 30, 17, 9, 6, 7, 11, 1, 29, 6, 13, 23, 24, 26, 3),
+    10: (7, 22, 25, 0, 23, 31, 0, 16, 21, 24, 3, 24, 12, 27, 8, 15,
+          21, 2, 9, 5, 14, 15, 26, 6, 2, 17, 21, 2, 12, 17, 30, 19),
+    11: (23, 26, 0, 21, 19, 17, 30, 16, 3, 6, 21, 4, 28, 13, 2, 27,
+          3, 22, 10, 31, 10, 7, 19, 10, 23, 20, 0, 22, 5, 0, 6, 23),
+    12: (27, 6, 23, 5, 24, 9, 29, 5, 23, 30, 29, 15, 14, 21, 4, 1,
+          0, 8, 23, 7, 5, 28, 16, 2, 7, 18, 3, 31, 25, 2, 16, 25),
+}
+
+
+def _check_height(h):
+    if not 1 <= h <= MAX_H:
+        raise ValueError(f"Высота h должна быть от 1 до {MAX_H}, получено {h}")
+
+
+def submatrix(h, w, seed=None):
+    """
+    Столбцы H^ как целые: бит t -- строка t; верхняя и нижняя строки всегда 1.
+    seed -- номер кандидата (по умолчанию -- из таблицы SEEDS).
+    """
+    _check_height(h)
+    if seed is None:
+        seed = SEEDS[h][w - 1] if 1 <= w <= MAX_W else 0
+    state = np.random.SeedSequence((h, w, seed)).generate_state(w, dtype=np.uint64)
+    cols = (state & np.uint64((1 << h) - 1)).astype(np.int64)
+    return cols | 1 | (1 << (h - 1))
+
+
+def layout(num_bits, available, segment=SEGMENT, max_w=MAX_W):
+    """
+    Отрезки группами одинаковых: список (число отрезков, L битов сообщения,
+    n битов контейнера на отрезок); последняя группа -- один укороченный отрезок.
+    """
+    if num_bits == 0:
+        return []
+    if num_bits > available:
+        raise ValueError(f"Сообщение из {num_bits} битов не помещается в {available} битов")
+    S = -(-num_bits // segment)
+    L = -(-num_bits // S)
+    total = min(available, max_w * num_bits)
+    n = total * L // num_bits
+    # n >= L, и последнему остаётся не меньше total * last_L / num_bits >= last_L
+    last_L = num_bits - (S - 1) * L
+    last_n = min(max_w * last_L, total - (S - 1) * n)
+    if (last_L, last_n) == (L, n):
+        return [(S, L, n)]
+    return ([(S - 1, L, n)] if S > 1 else []) + [(1, last_L, last_n)]
+
+
+def _spans(groups):
+    """(число отрезков, L, n, начало в контейнере, начало в сообщении) по группам."""
+    pos = off = 0
+    for count, L, n in groups:
+        yield count, L, n, pos, off
+        pos += count * n
+        off += count * L
+
+
+def used_bits(groups):
+    """Сколько битов контейнера занимают отрезки."""
+    return sum(count * n for count, _, n in groups)
+
+
+def block_widths(L, n):
+    """Ширины L блоков с суммой n: w0 = n // L или w0 + 1, лишние биты распределены равномерно."""
+    w0, extra = divmod(n, L)
+    i = np.arange(L + 1)
+    return w0 + np.diff(i * extra // L)
+
+
+def columns(h, L, n):
+    """
+    Столбец H для каждой из n позиций отрезка (одинаков для всех отрезков) и
+    начала блоков; строки за концом отрезка отброшены маской.
+    """
+    widths = block_widths(L, n)
+    starts = np.concatenate(([0], np.cumsum(widths)))
+    block = np.repeat(np.arange(L), widths)
+    j = np.arange(n) - starts[block]
+    w0 = int(widths.min())
+    table = np.zeros((2, w0 + 1), dtype=np.int64)
+    table[0, :w0] = submatrix(h, w0)
+    if widths.max() > w0:
+        table[1] = submatrix(h, w0 + 1)
+    masks = (1 << np.minimum(h, L - np.arange(L))) - 1
+    col = table[widths[block] - w0, j] & masks[block]
+    return col, starts
+
+
+def _viterbi_segment(x, rho, m, col, starts, h, path, y):
+    """
+    Витерби и обратный проход для одного отрезка (компилируется numba).
+    path (n, max(1, 2^h / 8)) uint8 -- рабочий буфер выборов в порядке
+    np.packbits, y -- выход. Возвращает False, если синдром недостижим.
+    """
+    size = 1 << h
+    half = size >> 1
+    cost = np.full(size, np.inf)
+    new = np.empty(size)
+    choice = np.zeros(max(size, 8), dtype=np.uint8)
+    words = choice.view(np.uint64)
+    cost[0] = 0.0
+    for i in range(len(m)):
+        for k in range(starts[i], starts[i + 1]):
+            c = col[k]
+            if x[k]:
+                add_stay, add_flip = rho[k], 0.0
+            else:
+                add_stay, add_flip = 0.0, rho[k]
+            for s in range(size):
+                stay = cost[s] + add_stay
+                flip = cost[s ^ c] + add_flip
+                new[s] = min(stay, flip)
+                choice[s] = flip < stay
+            # 8 байтов 0/1 -> байт, первый -- в старший бит (little-endian)
+            for j in range(len(words)):
+                path[k, j] = (words[j] * np.uint64(0x8040201008040201)) >> np.uint64(56)
+            cost, new = new, cost
+        bit = m[i]
+        for s in range(half):
+            new[s] = cost[2 * s + bit]
+        for s in range(half, size):
+            new[s] = np.inf
+        cost, new = new, cost
+    if not cost[0] < np.inf:
+        return False
+    s = 0
+    for i in range(len(m) - 1, -1, -1):
+        s = (s << 1) | m[i]
+        for k in range(starts[i + 1] - 1, starts[i] - 1, -1):
+            bit = (path[k, s >> 3] >> (7 - (s & 7))) & 1
+            y[k] = bit
+            if bit:
+                s ^= col[k]
+    return True
+
+
+if numba is not None:
+    _viterbi_segment = numba.njit(nogil=True)(_viterbi_segment)
+
+
+def _embed_numba(x, rho, m, col, starts, h):
+    S, n = x.shape
+    y = np.empty((S, n), dtype=np.uint8)
+    path = np.empty((n, max(1, (1 << h) // 8)), dtype=np.uint8)
+    ok = True
+    for seg in range(S):
+        ok &= _viterbi_segment(x[seg], rho[seg], m[seg], col, starts, h, path, y[seg])
+    return y, ok
+
+
+def _embed_numpy(x, rho, m, col, starts, h):
+    """Тот же Витерби по пачкам отрезков; буферы выделяются один раз на пачку."""
+    S, n = x.shape
+    size = 1 << h
+    half = size >> 1
+    states = np.arange(size)
+    # на позицию: байты выборов, две стоимости float64 и бит контейнера
+    batch = max(1, min(S, PATH_BYTES // (n * (max(1, size // 8) + 17))))
+    y = np.empty((S, n), dtype=np.uint8)
+    ok = True
+    cost = np.empty((batch, size))
+    new = np.empty((batch, size))
+    choice = np.empty((batch, size), dtype=bool)
+    path = np.empty((n, batch, max(1, size // 8)), dtype=np.uint8)
+    for first in range(0, S, batch):
+        B = min(batch, S - first)
+        xs, ms = x[first:first + B], m[first:first + B]
+        ones = xs.astype(bool)
+        add_stay = np.where(ones, rho[first:first + B], 0.0)  # стоимость y = 0
+        add_flip = np.where(ones, 0.0, rho[first:first + B])  # стоимость y = 1
+        c, nw, ch = cost[:B], new[:B], choice[:B]
+        c.fill(np.inf)
+        c[:, 0] = 0.0
+        for i in range(len(starts) - 1):
+            for k in range(starts[i], starts[i + 1]):
+                np.take(c, states ^ col[k], axis=1, out=nw)
+                nw += add_flip[:, k:k + 1]
+                c += add_stay[:, k:k + 1]
+                np.less(nw, c, out=ch)
+                np.copyto(c, nw, where=ch)
+                path[k, :B] = np.packbits(ch, axis=1)
+            # строка i завершена: её бит синдрома должен равняться m_i
+            nw[:, half:] = np.inf
+            nw[:, :half] = np.take_along_axis(c, 2 * states[:half] + ms[:, i:i + 1], axis=1)
+            c, nw = nw, c
+        ok &= bool(np.all(c[:, 0] < np.inf))
+        s = np.zeros(B, dtype=np.int64)
+        seg = np.arange(B)
+        for i in range(len(starts) - 2, -1, -1):
+            s = (s << 1) | ms[:, i]
+            for k in range(starts[i + 1] - 1, starts[i] - 1, -1):
+                bit = (path[k, seg, s >> 3] >> (7 - (s & 7))) & 1
+                y[first + seg, k] = bit
+                s ^= np.where(bit == 1, col[k], 0)
+    return y, ok
+
+
+def embed(cover_bits, message_bits, costs=None, h=H, segment=SEGMENT, max_w=MAX_W):
+    """
+    Стего-биты для начала cover_bits (used_bits(layout(...)) битов) с синдромами,
+    равными сообщению. costs -- стоимость изменения каждого бита контейнера
+    (np.inf -- менять нельзя).
+    """
+    _check_height(h)
+    cover_bits = np.asarray(cover_bits, dtype=np.uint8).reshape(-1)
+    message_bits = np.asarray(message_bits, dtype=np.uint8).reshape(-1)
+    groups = layout(len(message_bits), len(cover_bits), segment, max_w)
+    costs = None if costs is None else np.asarray(costs, dtype=np.float64).reshape(-1)
+    viterbi = _embed_numpy if numba is None else _embed_numba
+    parts = [cover_bits[:0]]
+    for count, L, n, pos, off in _spans(groups):
+        x = cover_bits[pos:pos + count * n].reshape(count, n)
+        rho = np.ones((count, n)) if costs is None else costs[pos:pos + count * n].reshape(count, n)
+        m = message_bits[off:off + count * L].reshape(count, L)
+        col, starts = columns(h, L, n)
+        y, ok = viterbi(x, rho, m, col, starts, h)
+        if not ok:
+            raise ValueError("Сообщение нельзя встроить: слишком много запрещённых позиций")
+        parts.append(y.reshape(-1))
+    return np.concatenate(parts)
+
+
+def extract(stego_bits, num_bits, h=H, segment=SEGMENT, max_w=MAX_W):
+    """Первые num_bits битов сообщения: синдромы H y всех отрезков."""
+    _check_height(h)
+    stego_bits = np.asarray(stego_bits, dtype=np.uint8).reshape(-1)
+    parts = [np.zeros(0, dtype=np.uint8)]
+    for count, L, n, pos, _ in _spans(layout(num_bits, len(stego_bits), segment, max_w)):
+        Y = stego_bits[pos:pos + count * n].reshape(count, n)
+        col, starts = columns(h, L, n)
+        m = np.zeros((count, L), dtype=np.uint8)
+        for t in range(min(h, L)):
+            row = ((col >> t) & 1).astype(np.uint8)                 # строка t подматриц
+            part = np.add.reduceat(Y & row, starts[:-1], axis=1) & 1  # вклад блока i в бит i + t
+            m[:, t:] ^= part[:, :L - t].astype(np.uint8)
+        parts.append(m.reshape(-1))
+    return np.concatenate(parts)
+
+
+def search_seeds(heights=range(3, MAX_H + 1), widths=range(1, MAX_W + 1), candidates=CANDIDATES,
+                 blocks=SEGMENT, trials=4, seed=0):
+    """
+    Пересчёт таблицы SEEDS: для каждой (h, w) -- кандидат с наименьшим числом
+    изменений на trials случайных отрезках из blocks битов сообщения
+    (одинаковых для всех кандидатов). Высоты 1 и 2 дают единственную подматрицу.
+    """
+    viterbi = _embed_numpy if numba is None else _embed_numba
+    table = {h: list(SEEDS[h]) for h in SEEDS}
+    for h in heights:
+        rng = np.random.default_rng(seed)
+        masks = (1 << np.minimum(h, blocks - np.arange(blocks))) - 1
+        for w in widths:
+            x = rng.integers(0, 2, (trials, blocks * w), dtype=np.uint8)
+            m = rng.integers(0, 2, (trials, blocks), dtype=np.uint8)
+            starts = np.arange(blocks + 1) * w
+            changes = []
+            for cand in range(candidates):
+                col = np.tile(submatrix(h, w, cand), blocks) & np.repeat(masks, w)
+                y, _ = viterbi(x, np.ones(x.shape), m, col, starts, h)
+                changes.append(int(np.count_nonzero(y != x)))
+            table[h][w - 1] = int(np.argmin(changes))
+    return {h: tuple(v) for h, v in table.items()}
+
+
+def texture_costs(arr, channels=None):
+    """
+    Пример стоимостей: 1 / (1 + локальное СКО 3 x 3) по каждому значению,
+    в логическом порядке битов lsb (гладкие области дороже текстурных).
+    """
+    a = np.asarray(arr, dtype=np.float64)
+    a = a if a.ndim == 3 else a[:, :, None]
+    p = np.pad(a, ((1, 1), (1, 1), (0, 0)), mode="edge")
+    H_, W_ = a.shape[:2]
+    s = sum(p[dy:dy + H_, dx:dx + W_] for dy in range(3) for dx in range(3)) / 9
+    s2 = sum(p[dy:dy + H_, dx:dx + W_] ** 2 for dy in range(3) for dx in range(3)) / 9
+    rho = 1.0 / (1.0 + np.sqrt(np.maximum(s2 - s * s, 0)))
+    if channels is not None:
+        rho = rho[:, :, list(channels)]
+    return rho.reshape(-1)
+
+
+def choose_height(num_bits, available):
+    """
+    Высота по доле нагрузки num_bits / available (таблица в описании модуля):
+    H от 1/16, LOW_RATE_H от 1/MAX_W; None -- ниже 1/MAX_W, где Хэмминг эффективнее.
+    """
+    if num_bits * 16 >= available:
+        return H
+    if num_bits * MAX_W >= available:
+        return LOW_RATE_H
+    return None
+
+
+def embed_array(arr, message_bits, h=None, costs=None, channels=None, bit=0):
+    """
+    Копия массива изображения с заголовком и сообщением, встроенным STC.
+    h = None -- по нагрузке (choose_height); при нагрузке ниже 1/MAX_W --
+    hamming.embed_array (costs тогда не используются).
+    costs -- стоимости для всех битов плоскости (как lsb_plane) или None.
+    """
+    message_bits = np.asarray(message_bits, dtype=np.uint8).reshape(-1)
+    num_bits = len(message_bits)
+    if num_bits >= 1 << hamming.LENGTH_BITS:
+        raise ValueError(f"Сообщение длиннее 2^{hamming.LENGTH_BITS} битов")
+    capacity = lsb.capacity(arr, channels)
+    head = hamming.header_cover_bits()
+    if h is None:
+        h = choose_height(num_bits, capacity - head)
+        if h is None:
+            return hamming.embed_array(arr, message_bits, channels=channels, bit=bit)[0]
+    used = used_bits(layout(num_bits, capacity - head))
+    cover = lsb.lsb_plane(arr, channels, bit, count=head + used)
+    rho = None if costs is None else np.asarray(costs, dtype=np.float64).reshape(-1)[head:head + used]
+    stego = np.concatenate((hamming.embed(cover[:head], hamming.header_bits(STC_MARK, num_bits), hamming.HEADER_R),
+                            embed(cover[head:], message_bits, rho, h)))
+    return lsb.set_lsb_plane(arr, stego, channels, bit)
+
+
+def extract_array(arr, h=None, channels=None, bit=0):
+    """
+    Сообщение из массива изображения, записанного stc.embed_array; h = None --
+    как при встраивании (для заголовка Хэмминга -- hamming.extract_array).
+    """
+    head = hamming.header_cover_bits()
+    header = hamming.extract(lsb.lsb_plane(arr, channels, bit, count=head), hamming.HEADER_R,
+                             4 + hamming.LENGTH_BITS)
+    r, num_bits = hamming.parse_header(header)
+    if r != STC_MARK and h is None:
+        return hamming.extract_array(arr, channels, bit)
+    capacity = lsb.capacity(arr, channels)
+    if r != STC_MARK or num_bits > capacity - head:
+        raise ValueError("Заголовок повреждён или сообщение встроено не STC")
+    if h is None:
+        h = choose_height(num_bits, capacity - head)
+        if h is None:
+            raise ValueError("Нагрузка ниже 1/MAX_W: высоту h нужно указать явно")
+    stego = lsb.lsb_plane(arr, channels, bit, count=head + used_bits(layout(num_bits, capacity - head)))
+    return extract(stego[head:], num_bits, h)
+
+
+def benchmark_stc(size=(256, 256, 3), payloads=(0.05, 0.1, 0.25, 0.45), heights=(None, 7, 10), seed=0):
+    """
+    Скорость (Мбит сообщения/с) и битов сообщения на изменение для STC и
+    матричного встраивания Хэммингом (hamming.embed_array с автоматическим r);
+    высота None -- выбор по нагрузке (choose_height). В конце -- случаи, где
+    STC меняет больше битов, чем Хэмминг; возвращаются строки таблицы и эти случаи.
+    """
+    rng = np.random.default_rng(seed)
+    arr = rng.integers(0, 256, size, dtype=np.uint8)
+    capacity = lsb.capacity(arr)
+    extract_array(embed_array(arr[:8, :8], [1, 0, 1] * 8, H), H)  # компиляция numba -- не в замерах
+    print(f"Контейнер {size}, numba: {'да' if numba is not None else 'нет'}")
+    print(f"{'нагрузка':<9} | {'метод':<10} | {'бит/изм.':<9} | {'Мбит/с':<8} | извлечение")
+    print("-" * 60)
+    rows, losses = [], []
+    for payload in payloads:
+        message = rng.integers(0, 2, int(capacity * payload), dtype=np.uint8)
+        runs = [("Хэмминг", lambda: hamming.embed_array(arr, message)[0], hamming.extract_array)]
+        runs += [("STC авто" if h is None else f"STC h={h}", lambda h=h: embed_array(arr, message, h),
+                  lambda a, h=h: extract_array(a, h)) for h in heights]
+        baseline = None
+        for name, do_embed, do_extract in runs:
+            start = time.perf_counter()
+            stego = do_embed()
+            elapsed = time.perf_counter() - start
+            ok = np.array_equal(do_extract(stego), message)
+            changes = int(np.count_nonzero((arr ^ stego) & 1))
+            per_change = len(message) / max(changes, 1)
+            speed = len(message) / elapsed / 1e6
+            print(f"{payload:<9.2f} | {name:<10} | {per_change:<9.3f} | {speed:<8.3f} | {'ok' if ok else 'ОШИБКА'}")
+            rows.append((payload, name, per_change, speed, ok))
+            if baseline is None:
+                baseline = per_change
+            elif per_change < baseline:
+                losses.append((payload, name, per_change, baseline))
+    print("STC хуже Хэмминга (бит/изм.): " + (", ".join(f"{name} при {payload:.2f}: {value:.3f} < {base:.3f}"
+                                                      for payload, name, value, base in losses) or "нет"))
+    return rows, losses
+
+
+if __name__ == "__main__":
+    benchmark_stc()
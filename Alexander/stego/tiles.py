@@ -0,0 +1,230 @@
+"""
+Потоковое встраивание и извлечение по полосам строк для изображений больше памяти.
+
+Источник читается полосами: двоичные PPM/PGM (P6/P5) и .npy отображаются в память
+(np.memmap), несжатый TIFF -- по полосам из таблицы тайлов Pillow (img.tile)
+тоже через memmap; остальные форматы декодируются Pillow целиком.
+Результат пишется по мере готовности: в PPM/PGM -- последовательно, в .npy --
+через open_memmap; прочие форматы собираются в память и сохраняются Pillow.
+
+Поток битов тот же, что у hamming.embed_array/extract_array (все каналы,
+младший бит): заголовок кодом (7, 3), затем сообщение кодом (2^r - 1, r).
+Блок может пересекать границу полос -- строки с незавершённым блоком
+остаются в буфере до следующей полосы, поэтому память ограничена размером
+полосы плюс одним блоком.
+"""
+import os
+
+import numpy as np
+
+from . import hamming
+
+ROWS = 256  # строк в полосе по умолчанию
+
+
+def _read_token(f):
+    token = b""
+    while True:
+        c = f.read(1)
+        if not c:
+            return token
+        if c == b"#" and not token:
+            f.readline()
+        elif c.isspace():
+            if token:
+                return token
+        else:
+            token += c
+
+
+def _open_pnm(path):
+    with open(path, "rb") as f:
+        magic = _read_token(f)
+        if magic not in (b"P5", b"P6"):
+            raise ValueError(f"{path}: поддерживаются только двоичные PGM/PPM (P5/P6)")
+        width, height, maxval = (int(_read_token(f)) for _ in range(3))
+        offset = f.tell()
+    if maxval > 255:
+        raise ValueError(f"{path}: поддерживается только 8 бит на канал")
+    shape = (height, width, 3) if magic == b"P6" else (height, width)
+    return np.memmap(path, dtype=np.uint8, mode="r", offset=offset, shape=shape)
+
+
+class _TiffStrips:
+    """Несжатый TIFF из полос на всю ширину: строки читаются memmap по смещениям из img.tile."""
+
+    def __init__(self, path, img):
+        channels = {"L": 1, "RGB": 3}[img.mode]
+        width, height = img.size
+        self.shape = (height, width, channels) if channels > 1 else (height, width)
+        self.strips = []
+        for tile in sorted(img.tile, key=lambda t: t[1][1]):
+            x0, y0, x1, y1 = tile[1]
+            strip = np.memmap(path, dtype=np.uint8, mode="r", offset=tile[2],
+                              shape=(y1 - y0,) + self.shape[1:])
+            self.strips.append((y0, y1, strip))
+
+    def __getitem__(self, rows):
+        start, stop, _ = rows.indices(self.shape[0])
+        parts = [s[max(start, y0) - y0:min(stop, y1) - y0]
+                 for y0, y1, s in self.strips if y0 < stop and y1 > start]
+        return np.concatenate(parts) if parts else np.zeros((0,) + self.shape[1:], dtype=np.uint8)
+
+
+def _raw_tiff(img):
+    if img.mode not in ("L", "RGB") or not img.tile:
+        return False
+    for tile in img.tile:
+        x0, y0, x1, y1 = tile[1]
+        rawmode = tile[3][0] if isinstance(tile[3], tuple) else tile[3]
+        if tile[0] != "raw" or rawmode != img.mode or (x0, x1) != (0, img.size[0]):
+            return False
+    return True
+
+
+def open_image(path):
+    """Объект с .shape и срезами по строкам; по возможности без чтения файла целиком."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".ppm", ".pgm", ".pnm"):
+        return _open_pnm(path)
+    if ext == ".npy":
+        return np.load(path, mmap_mode="r")
+    from PIL import Image
+    img = Image.open(path)
+    if img.format == "TIFF" and _raw_tiff(img):
+        return _TiffStrips(path, img)
+    if img.mode not in ("L", "RGB"):
+        img = img.convert("RGB")
+    return np.asarray(img)
+
+
+class _Writer:
+    """Построчная запись результата в файл по расширению."""
+
+    def __init__(self, path, shape):
+        self.path = path
+        self.shape = shape
+        self.row = 0
+        ext = os.path.splitext(path)[1].lower()
+        self.file = self.memmap = self.full = None
+        if ext in (".ppm", ".pgm", ".pnm"):
+            color = len(shape) == 3
+            if (color and shape[2] != 3) or (ext == ".pgm" and color) or (ext == ".ppm" and not color):
+                raise ValueError(f"{path}: формат не соответствует числу каналов {shape}")
+            self.file = open(path, "wb")
+            magic = b"P6" if color else b"P5"
+            self.file.write(magic + f"\n{shape[1]} {shape[0]}\n255\n".encode())
+        elif ext == ".npy":
+            self.memmap = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=shape)
+        else:
+            self.full = np.empty(shape, dtype=np.uint8)
+
+    def write(self, rows):
+        if self.file is not None:
+            self.file.write(np.ascontiguousarray(rows).tobytes())
+        elif self.memmap is not None:
+            self.memmap[self.row:self.row + len(rows)] = rows
+        else:
+            self.full[self.row:self.row + len(rows)] = rows
+        self.row += len(rows)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+        elif self.memmap is not None:
+            self.memmap.flush()
+            del self.memmap
+        else:
+            from PIL import Image
+            Image.fromarray(self.full).save(self.path)
+
+
+def _segments(message_bits, r):
+    """[(начальный бит, r, значения блоков)] для заголовка и сообщения."""
+    head = hamming.header_cover_bits()
+    return [(0, hamming.HEADER_R, hamming.pack_message(hamming.header_bits(r, len(message_bits)), hamming.HEADER_R)),
+            (head, r, hamming.pack_message(message_bits, r))]
+
+
+def embed_file(src_path, dst_path, message_bits, r=None, rows=ROWS):
+    """
+    Встраивает сообщение полосами по rows строк и пишет результат в dst_path.
+    Возвращает выбранное r.
+    """
+    src = open_image(src_path)
+    shape = src.shape
+    row_bits = int(np.prod(shape[1:]))
+    capacity = shape[0] * row_bits
+    message_bits = np.asarray(message_bits, dtype=np.uint8).reshape(-1)
+    r = hamming.choose_r(len(message_bits), capacity) if r is None else r
+    hamming.check_matrix(r)
+    if hamming.required_bits(len(message_bits), r) > capacity:
+        raise ValueError("Сообщение слишком длинное для данного изображения")
+    segments = _segments(message_bits, r)
+    writer = _Writer(dst_path, shape)
+    seg, blk = 0, 0          # текущий отрезок и первый невстроенный блок в нём
+    buf, base = None, 0      # строки, ещё не записанные в файл, и номер их первого бита
+    try:
+        for y in range(0, shape[0], rows):
+            strip = np.array(src[y:y + rows], dtype=np.uint8)
+            buf = strip if buf is None else np.concatenate((buf, strip))
+            flat = buf.reshape(-1)
+            end = base + flat.size
+            while seg < len(segments):
+                start, seg_r, values = segments[seg]
+                n = hamming.block_length(seg_r)
+                ready = min(len(values), max(0, (end - start) // n))
+                if ready > blk:
+                    a, b = start + blk * n - base, start + ready * n - base
+                    bits = hamming.embed(flat[a:b] & 1, hamming.unpack_message(values[blk:ready], seg_r), seg_r)
+                    flat[a:b] = (flat[a:b] & 0xFE) | bits
+                    blk = ready
+                if blk < len(values):
+                    break
+                seg, blk = seg + 1, 0
+            if seg < len(segments):
+                start, seg_r, _ = segments[seg]
+                pending = start + blk * hamming.block_length(seg_r)
+            else:
+                pending = end
+            done_rows = (pending - base) // row_bits
+            writer.write(buf[:done_rows])
+            buf, base = buf[done_rows:], base + done_rows * row_bits
+        writer.write(buf)
+    finally:
+        writer.close()
+    return r
+
+
+def _extract_segment(src, shape, start, r, count, rows):
+    """Синдромы count блоков длины 2^r - 1, начиная с бита start, по полосам строк."""
+    n = hamming.block_length(r)
+    row_bits = int(np.prod(shape[1:]))
+    stop = start + count * n
+    values = []
+    carry = np.zeros(0, dtype=np.uint8)
+    for y in range(start // row_bits, -(-stop // row_bits), rows):
+        strip = np.asarray(src[y:min(y + rows, -(-stop // row_bits))]).reshape(-1) & 1
+        lo = max(start - y * row_bits, 0)
+        hi = min(stop - y * row_bits, strip.size)
+        bits = np.concatenate((carry, strip[lo:hi].astype(np.uint8)))
+        full = len(bits) // n * n
+        values.append(hamming.syndromes(bits[:full].reshape(-1, n), r))
+        carry = bits[full:]
+    return np.concatenate(values) if values else np.zeros(0, dtype=np.int64)
+
+
+def extract_file(path, rows=ROWS):
+    """Сообщение из файла, записанного embed_file (или hamming.embed_array)."""
+    src = open_image(path)
+    shape = src.shape
+    capacity = int(np.prod(shape))
+    head = hamming.header_cover_bits()
+    header_blocks = head // hamming.block_length(hamming.HEADER_R)
+    values = _extract_segment(src, shape, 0, hamming.HEADER_R, header_blocks, rows)
+    r, num_bits = hamming.parse_header(hamming.unpack_message(values, hamming.HEADER_R))
+    if not 1 <= r <= hamming.MAX_R or hamming.required_bits(num_bits, r) > capacity:
+        raise ValueError("Заголовок повреждён или сообщение не встроено")
+    count = -(-num_bits // r)
+    values = _extract_segment(src, shape, head, r, count, rows)
+    return hamming.unpack_message(values, r)[:num_bits]
@@ -0,0 +1,48 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cyclic import catalogue, poly  # noqa: E402
+from cyclic.enumeration import enumerate_codes  # noqa: E402
+
+
+def _forbid_distances(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("расстояния пересчитаны, хотя есть в кэше")
+    monkeypatch.setattr(catalogue, "minimum_distances", fail)
+
+
+def test_cache_round_trip(tmp_path):
+    built = catalogue.get_catalogue(15, 2, cache_dir=str(tmp_path))
+    assert os.path.exists(os.path.join(str(tmp_path), "cyclic_15_2.npz"))
+    cached = catalogue.get_catalogue(15, 2, cache_dir=str(tmp_path))
+    assert isinstance(cached._data, np.lib.npyio.NpzFile)
+    for code in enumerate_codes(15, 2):
+        a, b = built.code(code['id']), cached.code(code['id'])
+        assert poly.to_key(a['g']) == poly.to_key(b['g']) == poly.to_key(code['g'])
+        assert (a['k'], a['d'], a['dual'], a['recip']) == (b['k'], b['d'], b['dual'], b['recip'])
+
+
+def test_missing_matrices_keep_distances(tmp_path, monkeypatch):
+    first = catalogue.get_catalogue(15, 2, matrix_ids=[3], cache_dir=str(tmp_path))
+    d = [first.code(i)['d'] for i in range(len(first))]
+    _forbid_distances(monkeypatch)
+    again = catalogue.get_catalogue(15, 2, matrix_ids=[3, 5], cache_dir=str(tmp_path))
+    assert [again.code(i)['d'] for i in range(len(again))] == d
+    assert again.matrix_ids() == [3, 5]
+    reloaded = catalogue.get_catalogue(15, 2, matrix_ids=[5], cache_dir=str(tmp_path))
+    assert isinstance(reloaded._data, np.lib.npyio.NpzFile)
+    assert reloaded.matrix_ids() == [3, 5]
+    assert np.array_equal(reloaded.matrices(5)["G"], again.matrices(5)["G"])
+
+
+def test_missing_distances_are_added(tmp_path):
+    plain = catalogue.get_catalogue(7, 3, distances=False, cache_dir=str(tmp_path))
+    assert not plain.has_distance
+    full = catalogue.get_catalogue(7, 3, cache_dir=str(tmp_path))
+    reference = catalogue.build_catalogue(7, 3)
+    assert full.has_distance
+    assert [c['d'] for c in full.codes()] == [c['d'] for c in reference.codes()]
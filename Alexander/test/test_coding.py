@@ -0,0 +1,57 @@
+import itertools
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cyclic import poly  # noqa: E402
+from cyclic.coding import CyclicCodec  # noqa: E402
+from cyclic.enumeration import enumerate_codes  # noqa: E402
+
+
+def _error_patterns(n, p, t):
+    """Все векторы ошибок веса 1..t."""
+    rows = []
+    for w in range(1, t + 1):
+        for pos in itertools.combinations(range(n), w):
+            for vals in itertools.product(range(1, p), repeat=w):
+                e = np.zeros(n, dtype=np.int64)
+                e[list(pos)] = vals
+                rows.append(e)
+    return np.array(rows)
+
+
+def _codes(n, p):
+    return [c for c in enumerate_codes(n, p) if 0 < c['k'] < n]
+
+
+@pytest.mark.parametrize("n, p", [(7, 2), (15, 2), (11, 3), (13, 3)])
+def test_corrects_every_pattern_up_to_t(n, p):
+    rng = np.random.default_rng(n * p)
+    for c in _codes(n, p):
+        codec = CyclicCodec(c['g'], n, p)
+        msgs = rng.integers(0, p, (4, codec.k))
+        words = codec.encode(msgs)
+        assert not np.any(codec.syndromes(words))
+        assert np.array_equal(codec.messages(words), msgs)
+        if codec.t == 0:
+            continue
+        E = _error_patterns(n, p, codec.t)
+        sent = words[np.arange(len(E)) % len(words)]
+        decoded, ok = codec.decode((sent + E) % p)
+        assert ok.all() and np.array_equal(decoded, sent), (n, p, c['id'])
+
+
+def test_wide_syndromes_without_overflow():
+    # r = 40 над GF(3): 3^40 > 2^63, ключи синдромов -- строки байтов
+    n, p = 41, 3
+    g = next(c['g'] for c in enumerate_codes(n, p) if poly.degree(c['g']) == 40)
+    codec = CyclicCodec(g, n, p, t=1)
+    assert codec.powers is None
+    words = codec.encode(np.ones((1, codec.k), dtype=np.int64))
+    E = _error_patterns(n, p, 1)
+    decoded, ok = codec.decode((words + E) % p)
+    assert ok.all() and np.array_equal(decoded, np.repeat(words, len(E), axis=0))
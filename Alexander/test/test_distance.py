@@ -0,0 +1,38 @@
+import itertools
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cyclic import poly  # noqa: E402
+from cyclic.distance import minimum_distance  # noqa: E402
+from cyclic.enumeration import enumerate_codes  # noqa: E402
+from cyclic.matrices import generator_matrix  # noqa: E402
+
+
+def _exhaustive(G, q):
+    """Наименьший вес ненулевого кодового слова перебором всех q^k сообщений."""
+    F = poly.field(q)
+    k = G.shape[0]
+    messages = np.array(list(itertools.product(range(q), repeat=k))[1:], dtype=np.int64)
+    return int(np.count_nonzero(F.matmul(messages, G), axis=1).min())
+
+
+@pytest.mark.parametrize("n, q", [(7, 2), (9, 2), (15, 2), (8, 3), (11, 3), (5, 4), (9, 4)])
+def test_matches_exhaustive_search(n, q):
+    for c in enumerate_codes(n, q):
+        G = generator_matrix(c['g'], n, q)
+        if c['k'] == 0:
+            assert minimum_distance(G, q) is None
+        elif q ** c['k'] <= 1 << 14:
+            assert minimum_distance(G, q) == _exhaustive(G, q), (n, q, c['id'])
+
+
+def test_known_codes():
+    golay = [1, 0, 1, 0, 1, 1, 1, 0, 0, 0, 1, 1]  # (23, 12) двоичный код Голея
+    assert minimum_distance(generator_matrix(np.array(golay), 23, 2), 2) == 7
+    hamming = [1, 1, 0, 1]  # (7, 4) код Хэмминга
+    assert minimum_distance(generator_matrix(np.array(hamming), 7, 2), 2) == 3
@@ -0,0 +1,56 @@
+import itertools
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cyclic import poly  # noqa: E402
+from cyclic.enumeration import count_by_dimension, enumerate_codes, mask_ranges  # noqa: E402
+from cyclic.factorization import factor_xn_minus_1  # noqa: E402
+
+
+def _divisors_by_products(n, q):
+    """Все нормированные делители x^n - 1 перебором подмножеств множителей."""
+    factors = factor_xn_minus_1(n, q)
+    found = set()
+    for bits in itertools.product((0, 1), repeat=len(factors)):
+        g = poly.trim([1])
+        for f, b in zip(factors, bits):
+            if b:
+                g = poly.mul(g, f, q)
+        found.add(poly.to_key(g))
+    return found
+
+
+@pytest.mark.parametrize("n, q", [(7, 2), (15, 2), (8, 3), (11, 3), (9, 4)])
+def test_every_divisor_once(n, q):
+    codes = list(enumerate_codes(n, q))
+    xn = poly.xn_minus_1(n, q)
+    assert sorted(c['id'] for c in codes) == list(range(1 << len(factor_xn_minus_1(n, q))))
+    assert {poly.to_key(c['g']) for c in codes} == _divisors_by_products(n, q)
+    assert len({poly.to_key(c['g']) for c in codes}) == len(codes)
+    for c in codes:
+        assert poly.to_key(poly.mul(c['g'], c['h'], q)) == poly.to_key(xn)
+        assert c['k'] == n - poly.degree(c['g'])
+
+
+@pytest.mark.parametrize("parts", [1, 3, 5])
+def test_ranges_cover_all_positions(parts):
+    n, q = 15, 2
+    factors = factor_xn_minus_1(n, q)
+    whole = [(c['id'], poly.to_key(c['g'])) for c in enumerate_codes(n, q, factors)]
+    pieces = []
+    for a, b in mask_ranges(len(factors), parts):
+        pieces += [(c['id'], poly.to_key(c['g'])) for c in enumerate_codes(n, q, factors, start=a, stop=b)]
+    assert pieces == whole
+
+
+def test_dimension_filter_and_counts():
+    n, q = 15, 2
+    codes = list(enumerate_codes(n, q))
+    counts = count_by_dimension(n, q)
+    assert sum(counts.values()) == len(codes)
+    for k, count in counts.items():
+        assert len(list(enumerate_codes(n, q, k=k))) == count
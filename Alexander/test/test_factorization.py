@@ -0,0 +1,54 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cyclic import poly  # noqa: E402
+from cyclic.factorization import cyclotomic_factorization, factor_xn_minus_1  # noqa: E402
+from cyclic.gf import prime_factors  # noqa: E402
+
+
+def _is_irreducible(f, q):
+    """Тест Рабина: x^(q^d) = x mod f и НОД(x^(q^(d/r)) - x, f) = 1 для простых r | d."""
+    d = poly.degree(f)
+    x = poly.divmod_(np.array([0, 1], dtype=np.int64), f, q)[1]
+
+    def frobenius(k):
+        return poly.powmod(x, q ** k, f, q)
+
+    if poly.to_key(poly.sub(frobenius(d), x, q)) != (0,):
+        return False
+    for r in prime_factors(d):
+        a, b = poly.trim(f), poly.sub(frobenius(d // r), x, q)
+        while poly.degree(b) >= 0:
+            a, b = b, poly.divmod_(a, b, q)[1]
+        if poly.degree(a) > 0:
+            return False
+    return True
+
+
+@pytest.mark.parametrize("n, q", [(11, 8), (23, 4), (23, 3), (121, 2)])
+def test_factors_multiply_to_xn_minus_1(n, q):
+    pairs = cyclotomic_factorization(n, q)
+    product = np.ones(1, dtype=np.int64)
+    for coset, f in pairs:
+        assert poly.degree(f) == len(coset)
+        assert int(f[-1]) == 1
+        assert _is_irreducible(f, q)
+        product = poly.mul(product, f, q)
+    assert poly.to_key(product) == poly.to_key(poly.xn_minus_1(n, q))
+    assert sorted(c for coset, _ in pairs for c in coset) == list(range(n))
+
+
+def test_extension_field_degrees():
+    # GF(8^10) и GF(4^11) не помещаются в таблицы: множители строятся без поля разложения
+    assert sorted(poly.degree(f) for f in factor_xn_minus_1(11, 8)) == [1, 10]
+    assert sorted(poly.degree(f) for f in factor_xn_minus_1(23, 4)) == [1, 11, 11]
+
+
+def test_rejects_repeated_roots():
+    with pytest.raises(ValueError):
+        factor_xn_minus_1(12, 4)
@@ -0,0 +1,31 @@
+import os
+import sys
+from functools import reduce
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stego import hamming  # noqa: E402
+
+
+def test_syndromes_match_position_xor():
+    rng = np.random.default_rng(0)
+    for r in range(1, 13):
+        n = hamming.block_length(r)
+        blocks = rng.integers(0, 2, (20, n), dtype=np.uint8)
+        expected = [reduce(lambda a, b: a ^ b, (i + 1 for i in np.nonzero(row)[0]), 0) for row in blocks]
+        assert hamming.syndromes(blocks, r).tolist() == expected
+        assert np.array_equal(hamming.syndromes(blocks, r),
+                              ((blocks.astype(np.int64) @ hamming.check_matrix(r).T) & 1) @ hamming._weights(r))
+
+
+def test_round_trip_changes_at_most_one_bit_per_block():
+    rng = np.random.default_rng(1)
+    for r in (2, 3, 7, 11):
+        n = hamming.block_length(r)
+        message = rng.integers(0, 2, 5 * r + 1, dtype=np.uint8)
+        cover = rng.integers(0, 2, 6 * n, dtype=np.uint8)
+        stego = hamming.embed(cover, message, r)
+        assert np.all((stego != cover[:len(stego)]).reshape(-1, n).sum(axis=1) <= 1)
+        assert np.array_equal(hamming.extract(stego, r, len(message)), message)
@@ -0,0 +1,41 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cyclic import poly  # noqa: E402
+from cyclic.enumeration import enumerate_codes  # noqa: E402
+from cyclic.matrices import (generator_matrix, is_orthogonal, parity_matrix, rref_mod_p,  # noqa: E402
+                             systematic_from_matrix, systematic_matrices)
+
+
+def _rank(M, q):
+    return len(rref_mod_p(M, q)[1])
+
+
+@pytest.mark.parametrize("n, q", [(7, 2), (15, 2), (8, 3), (11, 3), (9, 4)])
+def test_matrices_of_every_code(n, q):
+    F = poly.field(q)
+    for c in enumerate_codes(n, q):
+        k = c['k']
+        if not 0 < k < n:
+            continue
+        G, H = generator_matrix(c['g'], n, q), parity_matrix(c['h'], n, q)
+        G_sys, H_sys = systematic_matrices(c['g'], n, q)
+        assert G.shape == G_sys.shape == (k, n)
+        assert H.shape == H_sys.shape == (n - k, n)
+        assert is_orthogonal(G, H, q) and is_orthogonal(G_sys, H_sys, q)
+        assert is_orthogonal(G_sys, H, q)
+        assert np.array_equal(G_sys[:, :k], np.eye(k, dtype=np.int64))
+        # одно и то же пространство: ранг объединения строк равен k
+        assert _rank(G, q) == _rank(G_sys, q) == _rank(np.vstack((G, G_sys)), q) == k
+        assert _rank(H, q) == n - k
+        # каждая строка G_sys -- кодовое слово: делится на g(x)
+        for row in G_sys:
+            assert poly.degree(poly.divmod_(row, c['g'], q)[1]) < 0
+        S, T = systematic_from_matrix(G, q)
+        if S is not None:
+            assert np.array_equal(S, G_sys) and not np.any(F.matmul(S, T.T))
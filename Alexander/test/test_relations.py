@@ -0,0 +1,27 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cyclic import poly  # noqa: E402
+from cyclic.enumeration import enumerate_codes  # noqa: E402
+from cyclic.factorization import factor_xn_minus_1  # noqa: E402
+from cyclic.relations import code_index, reciprocal_permutation, relations  # noqa: E402
+
+
+@pytest.mark.parametrize("n, q", [(7, 2), (15, 2), (8, 3), (13, 3), (9, 4)])
+def test_dual_and_reciprocal_by_search(n, q):
+    factors = factor_xn_minus_1(n, q)
+    codes = list(enumerate_codes(n, q, factors))
+    index = code_index(codes)
+    ids = np.array([c['id'] for c in codes], dtype=np.int64)
+    dual, recip, self_dual, reversible = relations(ids, reciprocal_permutation(factors, q))
+    for i, c in enumerate(codes):
+        # двойственный код порождается h*(x), возвратный -- g*(x)
+        assert dual[i] == index[poly.to_key(poly.reciprocal(c['h'], q))]
+        assert recip[i] == index[poly.to_key(poly.reciprocal(c['g'], q))]
+        assert self_dual[i] == (dual[i] == c['id'])
+        assert reversible[i] == (recip[i] == c['id'])
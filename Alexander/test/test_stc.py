@@ -0,0 +1,79 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stego import hamming, lsb, stc  # noqa: E402
+
+
+def _check_layout(num_bits, available, segment, max_w):
+    groups = stc.layout(num_bits, available, segment, max_w)
+    assert sum(count * L for count, L, _ in groups) == num_bits
+    assert stc.used_bits(groups) <= available
+    for count, L, n in groups:
+        assert count >= 1 and 1 <= L <= segment and L <= n <= max_w * L
+    assert len(groups) <= 2 and sum(count for count, _, _ in groups) == -(-num_bits // segment)
+
+
+def test_layout_fills_capacity():
+    for segment, max_w in ((1, 1), (3, 2), (7, 4), (16, 32)):
+        for available in range(1, 80):
+            for num_bits in range(1, available + 1):
+                _check_layout(num_bits, available, segment, max_w)
+    _check_layout(1025, 1025, stc.SEGMENT, stc.MAX_W)
+    _check_layout(3 * stc.SEGMENT + 1, 3 * stc.SEGMENT + 2, stc.SEGMENT, stc.MAX_W)
+    with pytest.raises(ValueError):
+        stc.layout(11, 10)
+
+
+@pytest.mark.parametrize("num_bits,available", [(1025, 1025), (1025, 1030), (2500, 2503), (700, 30000)])
+def test_round_trip_uneven(num_bits, available):
+    rng = np.random.default_rng(num_bits)
+    cover = rng.integers(0, 2, available, dtype=np.uint8)
+    message = rng.integers(0, 2, num_bits, dtype=np.uint8)
+    for h in (1, 4, 7):
+        stego = stc.embed(cover, message, h=h)
+        assert len(stego) == stc.used_bits(stc.layout(num_bits, available))
+        assert np.array_equal(stc.extract(stego, num_bits, h=h), message)
+
+
+def test_numpy_matches_numba():
+    rng = np.random.default_rng(1)
+    x = rng.integers(0, 2, (5, 300), dtype=np.uint8)
+    rho = rng.random((5, 300))
+    m = rng.integers(0, 2, (5, 37), dtype=np.uint8)
+    col, starts = stc.columns(6, 37, 300)
+    y, ok = stc._embed_numpy(x, rho, m, col, starts, 6)
+    assert ok
+    if stc.numba is not None:
+        y2, ok2 = stc._embed_numba(x, rho, m, col, starts, 6)
+        assert ok2 and np.array_equal(y, y2)
+
+
+def test_forbidden_positions_unchanged():
+    rng = np.random.default_rng(2)
+    cover = rng.integers(0, 2, 4000, dtype=np.uint8)
+    message = rng.integers(0, 2, 1000, dtype=np.uint8)
+    costs = np.ones(4000)
+    costs[::3] = np.inf
+    stego = stc.embed(cover, message, costs, h=7)
+    assert np.array_equal(stego[::3], cover[:len(stego)][::3])
+    assert np.array_equal(stc.extract(stego, 1000, h=7), message)
+
+
+def test_choose_height_and_hamming_fallback():
+    rng = np.random.default_rng(3)
+    arr = rng.integers(0, 256, (64, 64, 3), dtype=np.uint8)
+    available = lsb.capacity(arr) - hamming.header_cover_bits()
+    for num_bits, h in ((available, stc.H), (-(-available // 16), stc.H),
+                        (available // 20, stc.LOW_RATE_H), (available // 64, None)):
+        assert stc.choose_height(num_bits, available) == h
+        message = rng.integers(0, 2, num_bits, dtype=np.uint8)
+        stego = stc.embed_array(arr, message)
+        r, _ = hamming.parse_header(hamming.extract(lsb.lsb_plane(stego, count=hamming.header_cover_bits()),
+                                                    hamming.HEADER_R, 4 + hamming.LENGTH_BITS))
+        assert (r == stc.STC_MARK) == (h is not None)
+        assert np.array_equal(stc.extract_array(stego), message)
@@ -0,0 +1,139 @@
+"""
+Модели канала для пакетного моделирования: векторы ошибок сразу для всей
+пачки из M слов длины n (матрица M x n) без цикла по словам.
+
+Все модели возвращают пару (E, support):
+    E       -- матрица ошибок (элементы поля, если задано gf, иначе int64);
+    support -- булева матрица M x n истинных позиций ошибок/стираний.
+"""
+import sys
+import time
+
+import numpy as np
+
+from fields import get_field
+
+
+class Channel:
+    def __init__(self, n, gf=None, order=None, seed=None):
+        if gf is None and order is None:
+            raise ValueError("Нужно задать поле gf или его порядок order")
+        self.n = n
+        self.gf = gf
+        self.order = gf.order if gf is not None else order
+        self.rng = np.random.default_rng(seed)
+
+    def _values(self, support, low=1):
+        """Случайные значения в позициях support (ненулевые при low=1)"""
+        values = self.rng.integers(low, self.order, size=support.shape) * support
+        return (self.gf(values) if self.gf is not None else values), support
+
+    def fixed_weight(self, M, t):
+        """Ровно t ошибок в каждом слове, позиции равновероятны"""
+        if not 0 <= t <= self.n:
+            raise ValueError(f"Число ошибок должно быть от 0 до {self.n}, получено {t}")
+        support = np.zeros((M, self.n), dtype=bool)
+        if t > 0:
+            keys = self.rng.random((M, self.n))
+            positions = np.argpartition(keys, t - 1, axis=1)[:, :t]
+            np.put_along_axis(support, positions, True, axis=1)
+        return self._values(support)
+
+    def symbol_errors(self, M, p):
+        """Независимые ошибки: каждый символ искажается с вероятностью p"""
+        support = self.rng.random((M, self.n)) < p
+        return self._values(support)
+
+    def burst(self, M, length, density=1.0):
+        """
+        Пакет ошибок длины length со случайным началом в каждом слове;
+        внутри пакета символ искажается с вероятностью density
+        (первый и последний символы пакета искажаются всегда).
+        """
+        if not 1 <= length <= self.n:
+            raise ValueError(f"Длина пакета должна быть от 1 до {self.n}, получено {length}")
+        start = self.rng.integers(0, self.n - length + 1, size=M)[:, None]
+        pos = np.arange(self.n)
+        inside = (pos >= start) & (pos < start + length)
+        edges = (pos == start) | (pos == start + length - 1)
+        support = inside & ((self.rng.random((M, self.n)) < density) | edges)
+        return self._values(support)
+
+    def erasures(self, M, p):
+        """
+        Стирания: каждый символ теряется с вероятностью p. Позиции стираний
+        известны приёмнику (support), значение в них произвольное (в т.ч. 0).
+        """
+        support = self.rng.random((M, self.n)) < p
+        return self._values(support, low=0)
+
+    def transmit(self, codewords, model, *args, **kwargs):
+        """Передача пачки кодовых слов: возвращает (принятые слова, support)"""
+        E, support = getattr(self, model)(codewords.shape[0], *args, **kwargs)
+        return codewords + E, support
+
+
+def score_supports(true_support, found_support):
+    """
+    Точность декодера по позициям ошибок для всей пачки:
+    доля слов с точно найденным носителем, precision и recall по символам.
+    """
+    true_support = np.asarray(true_support, dtype=bool)
+    found_support = np.asarray(found_support, dtype=bool)
+    hits = np.count_nonzero(true_support & found_support)
+    found = np.count_nonzero(found_support)
+    actual = np.count_nonzero(true_support)
+    return {
+        'word_accuracy': np.mean(np.all(true_support == found_support, axis=1)),
+        'precision': hits / found if found else 1.0,
+        'recall': hits / actual if actual else 1.0,
+    }
+
+
+def benchmark_channel(n=15, k=7, M=2000):
+    """Генерация ошибок: цикл RSCodes.add_error против пакетной Channel.fixed_weight"""
+    from main import RSCodes
+
+    GF = get_field(2**6)
+    rs = RSCodes(n, k, GF)
+    channel = Channel(n, GF, seed=1)
+    # Кодирование пачки: c = m @ V, V[j, i] = alpha_i^j
+    codewords = GF.Random((M, k)) @ (rs.alpha ** np.arange(k)[:, None])
+    rs.add_error(codewords[0], rs.v)  # прогрев JIT
+    channel.transmit(codewords[:2], 'fixed_weight', rs.v)
+
+    print("=" * 60)
+    print(f"МОДЕЛЬ КАНАЛА: n={n}, k={k}, слов: {M}, ошибок в слове: {rs.v}")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    for i in range(M):
+        rs.add_error(codewords[i], rs.v)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    received, support = channel.transmit(codewords, 'fixed_weight', rs.v)
+    batch_time = time.perf_counter() - start
+    print(f"RSCodes.add_error (по словам): {loop_time:.4f} с")
+    print(f"Channel.fixed_weight (пачка):  {batch_time:.4f} с (x{loop_time / batch_time:.0f})")
+
+    for model, args in [('symbol_errors', (0.1,)), ('burst', (rs.v,)), ('erasures', (0.1,))]:
+        start = time.perf_counter()
+        _, s = channel.transmit(codewords, model, *args)
+        print(f"Channel.{model:<14} {time.perf_counter() - start:.4f} с, "
+              f"средний вес: {s.sum(axis=1).mean():.2f}")
+
+    # Оценка декодера БМ по истинным носителям ошибок
+    words = min(M, 200)
+    found = np.zeros((words, n), dtype=bool)
+    for i in range(words):
+        f = rs.decode_berlekamp_massey(received[i])
+        if f is not None:
+            found[i] = f(rs.alpha) != received[i]
+    score = score_supports(support[:words], found)
+    print(f"Декодер БМ на {words} словах: слов без ошибок {score['word_accuracy']:.3f}, "
+          f"precision {score['precision']:.3f}, recall {score['recall']:.3f}")
+
+
+if __name__ == "__main__":
+    benchmark_channel(M=int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,170 @@
+"""
+Быстрый старт для полей Галуа:
+- ленивый импорт galois (модуль загружается при первом обращении);
+- одно поле GF(q) на процесс (get_field);
+- прогрев JIT перед fork пула процессов, чтобы воркеры получили готовые поля;
+- режим быстрого старта без JIT numba для коротких CLI-запусков.
+"""
+import importlib
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# galois распараллеливает часть функций (numba.prange); слой потоков TBB,
+# который numba выбирает по умолчанию, после fork не даёт родителю завершиться.
+# Пулы здесь рассчитаны на fork (prefork_warmup), поэтому -- workqueue
+os.environ.setdefault("NUMBA_THREADING_LAYER", "workqueue")
+
+
+class LazyModule:
+    """Модуль, который импортируется при первом обращении к атрибуту"""
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def is_loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+galois = LazyModule("galois")
+
+_fields = {}
+
+
+def startup_mode():
+    """
+    Режим быстрого старта: JIT numba отключается, ufunc-и galois выполняются
+    интерпретатором. Для небольших полей и коротких запусков это быстрее, чем
+    компиляция. Вызывать до первого обращения к galois.
+    """
+    if "numba" in sys.modules:
+        raise RuntimeError("startup_mode() нужно вызвать до импорта galois/numba")
+    os.environ["NUMBA_DISABLE_JIT"] = "1"
+
+
+def get_field(order):
+    """
+    GF(order), построенное один раз на процесс. Дискового кэша нет намеренно:
+    таблицы log/antilog строятся за миллисекунды, а ufunc-и galois компилируются
+    без cache=True, с таблицами поля в глобальных переменных -- кэш numba по
+    функции вернул бы для другого поля чужие таблицы. Готовые поля между
+    процессами передаются через fork (prefork_warmup).
+    """
+    if order not in _fields:
+        _fields[order] = galois.GF(order)
+    return _fields[order]
+
+
+def warmup(field, n=8):
+    """
+    Прогрев ufunc-ов galois, которые использует main.py: после вызова JIT-
+    компиляция уже выполнена и не попадает во время первого вычисления.
+    """
+    a = field.Random(n, low=1)
+    b = field.Random(n, low=1)
+    M = field.Random((n, n))
+    _ = a + b, a - b, a * b, a / b, -a, a ** 3, a ** -1, np.sum(a)
+    _ = M @ a, a @ M, M @ M
+    _ = a ** np.arange(n)[:, None]
+    f = galois.Poly(a, field=field)
+    g = galois.Poly(b[:3], field=field)
+    _ = f(b), divmod(f, g), f * g, f - g
+    _ = galois.lagrange_poly(field.elements[1:4], a[:3])
+    _ = M[:2].null_space()
+
+
+def prefork_warmup(orders=(2**6,)):
+    """
+    Хук перед созданием пула процессов (fork): поля строятся и прогреваются
+    в родителе, воркеры наследуют их вместе со скомпилированными ufunc-ами.
+    """
+    fields = {}
+    for order in orders:
+        fields[order] = get_field(order)
+        warmup(fields[order])
+    return fields
+
+
+def pool_initializer(orders=(2**6,)):
+    """Инициализатор воркеров для spawn-пулов: поля строятся и прогреваются до первой задачи"""
+    for order in orders:
+        warmup(get_field(order))
+
+
+def _first_use(order):
+    """Время получения поля и первых операций (JIT, если он ещё не выполнен)."""
+    start = time.perf_counter()
+    field = get_field(order)
+    ready = time.perf_counter()
+    warmup(field)
+    return ready - start, time.perf_counter() - ready
+
+
+def _child(order):
+    print("{:.4f} {:.4f}".format(*_first_use(order)))
+
+
+def benchmark_startup(order=2**6, runs=3):
+    """
+    Холодный и тёплый старт: новый процесс с JIT, новый процесс без JIT
+    (startup_mode) и воркер, созданный fork после prefork_warmup в родителе.
+    Для каждого -- полное время, время получения поля и первых операций.
+    """
+    print("=" * 60)
+    print(f"СТАРТ GF({order}): холодный и тёплый")
+    print("=" * 60)
+    print(f"{'Режим':<16} | {'процесс, с':<10} | {'поле, с':<8} | {'первые операции, с':<18}")
+    print("-" * 62)
+
+    results = {}
+
+    def report(name, times):
+        total, field_time, ops_time = np.median(np.array(times), axis=0)
+        results[name] = total
+        print(f"{name:<16} | {total:<10.3f} | {field_time:<8.3f} | {ops_time:<18.3f}")
+
+    for name, jit in (("холодный, JIT", True), ("без JIT", False)):
+        env = dict(os.environ)
+        if jit:
+            env.pop("NUMBA_DISABLE_JIT", None)
+        else:
+            env["NUMBA_DISABLE_JIT"] = "1"
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", str(order)],
+                env=env, capture_output=True, text=True, check=True,
+            ).stdout.split()
+            times.append((time.perf_counter() - start, float(out[0]), float(out[1])))
+        report(name, times)
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        start = time.perf_counter()
+        prefork_warmup((order,))
+        print(f"(прогрев в родителе: {time.perf_counter() - start:.3f} с)")
+        ctx = multiprocessing.get_context("fork")
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            with ctx.Pool(1) as pool:
+                field_time, ops_time = pool.apply(_first_use, (order,))
+            times.append((time.perf_counter() - start, field_time, ops_time))
+        report("тёплый, fork", times)
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--child":
+        _child(int(sys.argv[2]))
+    else:
+        benchmark_startup(int(sys.argv[1]) if len(sys.argv) > 1 else 2**6)
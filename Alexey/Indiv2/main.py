@@ -1,5 +1,9 @@
+import sys
+import time
+
 import numpy as np
-import galois
+
+from fields import galois, get_field, startup_mode
 
 # --- ЧАСТЬ 1: Класс для работы с кодами Рида-Соломона ---
 class RSCodes:
@@ -10,6 +14,7 @@ class RSCodes:
         # Точки оценки (alpha_1, ..., alpha_n)
         self.alpha = self.gf.elements[1:n+1] 
         self.v = (n - k) // 2
+        self._plan = None
 
     def encode(self, message):
         """Кодирование: c = (f(alpha_1), ..., f(alpha_n))"""
@@ -54,6 +59,24 @@ class RSCodes:
         f_recovered, remainder = divmod(N_poly, L_poly)
         return f_recovered if remainder == 0 else None
 
+    def decoder_plan(self):
+        """
+        Предвычисления декодера БМ, не зависящие от принятого слова
+        (кэшируются): веса GRS, матрица синдромов w_i * alpha_i^j и
+        обратные локаторы для поиска Ченя.
+        """
+        if self._plan is None:
+            weights = self.gf.Zeros(self.n)
+            for i in range(self.n):
+                denom = self.gf(1)
+                for j in range(self.n):
+                    if i != j:
+                        denom *= (self.alpha[i] - self.alpha[j])
+                weights[i] = self.gf(1) / denom
+            syndrome_matrix = (self.alpha ** np.arange(2 * self.v)[:, None]) * weights
+            self._plan = (weights, syndrome_matrix, self.alpha ** -1)
+        return self._plan
+
     def decode_berlekamp_massey(self, z):
         """
         БОНУС: Честная реализация декодера Берлекэмпа-Мэсси.
@@ -63,20 +86,11 @@ class RSCodes:
         4. Поиск корней (Chien Search).
         5. Восстановление по чистым точкам.
         """
-        # 1. Вычисление весов для GRS
-        weights = self.gf.Zeros(self.n)
-        for i in range(self.n):
-            denom = self.gf(1)
-            for j in range(self.n):
-                if i != j:
-                    denom *= (self.alpha[i] - self.alpha[j])
-            weights[i] = self.gf(1) / denom
-
-        # 2. Вычисление синдромов
-        syndromes = self.gf.Zeros(2 * self.v)
-        for j in range(2 * self.v):
-            term = z * weights * (self.alpha ** j)
-            syndromes[j] = np.sum(term)
+        # 1. Веса для GRS (из кэша плана декодера)
+        _, syndrome_matrix, inv_alpha = self.decoder_plan()
+
+        # 2. Вычисление синдромов: S_j = sum_i z_i * w_i * alpha_i^j
+        syndromes = syndrome_matrix @ z
 
         # 3. Алгоритм Берлекэмпа-Мэсси (Ядро)
         Lambda = galois.Poly([1], field=self.gf)
@@ -103,11 +117,7 @@ class RSCodes:
                     Lambda = T
 
         # 4. Поиск корней (Chien Search)
-        error_indices = []
-        for i in range(self.n):
-            inv_loc = self.alpha[i] ** -1
-            if Lambda(inv_loc) == 0:
-                error_indices.append(i)
+        error_indices = np.nonzero(Lambda(inv_alpha) == 0)[0].tolist()
         
         # 5. Восстановление
         valid_indices = [i for i in range(self.n) if i not in error_indices]
@@ -123,33 +133,60 @@ class RSCodes:
 
 # --- ЧАСТЬ 2: Класс для моделирования MPC ---
 class MPC_Simulation:
-    def __init__(self, n, lambda_weights, gf):
+    def __init__(self, n, lambda_weights, gf, t_shamir=None):
         self.n = n
         self.weights = lambda_weights
         self.gf = gf
-        self.t_shamir = (n - 1) // 3  
+        self.t_shamir = (n - 1) // 3 if t_shamir is None else t_shamir
         self.k_code = self.t_shamir + 1
         self.rs = RSCodes(n, self.k_code, gf)
+        self.ell = 1  # восстанавливаемых сумм за раунд
+
+    def random_secrets(self):
+        return self.gf.Random(self.n)
+
+    def share_row(self, secret):
+        """Доли одного секрета: f(alpha_1), ..., f(alpha_n), f(0) = secret"""
+        coeffs = np.concatenate(([secret], self.gf.Random(self.k_code - 1)))
+        f = galois.Poly(coeffs[::-1], field=self.gf)
+        return f(self.rs.alpha)
+
+    def share(self, secrets):
+        """(a) Разделение: строка j -- доли секрета участника j"""
+        shares_matrix = self.gf.Zeros((self.n, self.n))
+        for j in range(self.n):
+            shares_matrix[j, :] = self.share_row(secrets[j])
+        return shares_matrix
+
+    def compute(self, shares_matrix):
+        """(b) Локальные вычисления: z_i = sum_j lambda_j * share_{j,i}"""
+        z_vector = self.gf.Zeros(self.n)
+        for i in range(self.n):
+            z_vector[i] = np.sum(self.weights * shares_matrix[:, i])
+        return z_vector
+
+    def reconstruct(self, corrupted_z):
+        """(d) Восстановление: возвращает (S, обманщики) или (None, [])"""
+        recovered_poly = self.rs.decode_berlekamp_massey(corrupted_z)
+        if recovered_poly is None:
+            return None, []
+        recalculated_z = recovered_poly(self.rs.alpha)
+        cheaters = [i for i in range(self.n) if recalculated_z[i] != corrupted_z[i]]
+        return recovered_poly(0), cheaters
 
     def run(self):
         print("\n" + "="*60)
         print("ЗАДАНИЕ 2: MPC ПРОТОКОЛ (СХЕМА ШАМИРА)")
         print("="*60)
         
-        secrets = self.gf.Random(self.n)
+        secrets = self.random_secrets()
         target_S = np.sum(self.weights * secrets)
 
         # (a) Разделение
-        shares_matrix = self.gf.Zeros((self.n, self.n))
-        for j in range(self.n):
-            coeffs = np.concatenate(([secrets[j]], self.gf.Random(self.k_code - 1)))
-            f_j = galois.Poly(coeffs[::-1], field=self.gf)
-            shares_matrix[j, :] = f_j(self.rs.alpha)
+        shares_matrix = self.share(secrets)
 
         # (b) Вычисления
-        z_vector = self.gf.Zeros(self.n)
-        for i in range(self.n):
-            z_vector[i] = np.sum(self.weights * shares_matrix[:, i])
+        z_vector = self.compute(shares_matrix)
 
         print(f"--- Запуск MPC (Участников: {self.n}, Порог k: {self.k_code}) ---")
         print(f"1. Истинная сумма секретов (S): {target_S}")
@@ -161,12 +198,11 @@ class MPC_Simulation:
         print(f"3. Вектор с ошибками (атака {errors_count} чел.): {corrupted_z}")
 
         # (d) Восстановление
-        recovered_poly = self.rs.decode_berlekamp_massey(corrupted_z)
+        calculated_S, cheaters = self.reconstruct(corrupted_z)
         
-        if recovered_poly is None:
+        if calculated_S is None:
             print("ОШИБКА: Не удалось восстановить результат.")
         else:
-            calculated_S = recovered_poly(0)
             print(f"4. Восстановленное S (через Берлекэмп-Мэсси): {calculated_S}")
             
             if calculated_S == target_S:
@@ -174,13 +210,221 @@ class MPC_Simulation:
             else:
                 print(">>> ИТОГ: ПРОВАЛ!")
             
-            recalculated_z = recovered_poly(self.rs.alpha)
-            cheaters = [i for i in range(self.n) if recalculated_z[i] != corrupted_z[i]]
             print(f"   Обнаруженные обманщики (индексы): {cheaters}")
 
+
+# --- ЧАСТЬ 3: Упакованная схема Шамира (packed secret sharing) ---
+class PackedMPC_Simulation(MPC_Simulation):
+    """
+    Упакованная схема Шамира: полином каждого участника несёт ell секретов
+    в зарезервированных точках beta_1, ..., beta_ell (а не один секрет в x=0).
+    Степень полинома t + ell - 1, поэтому при t = t_plain - ell + 1 длина
+    кода k и число исправляемых ошибок те же, что и в обычной схеме,
+    а за один раунд восстанавливается ell взвешенных сумм.
+    """
+    def __init__(self, n, lambda_weights, gf, ell, t_shamir=None):
+        if t_shamir is None:
+            t_shamir = (n - 1) // 3 - ell + 1
+        if t_shamir < 1:
+            raise ValueError(f"Слишком много секретов в полиноме: ell={ell}, порог t={t_shamir}")
+        if n + 1 + ell > gf.order:
+            raise ValueError(f"Поле GF({gf.order}) слишком мало для n={n} и ell={ell}")
+        super().__init__(n, lambda_weights, gf, t_shamir)
+        self.ell = ell
+        self.k_code = self.t_shamir + ell
+        self.rs = RSCodes(n, self.k_code, gf)
+        # Зарезервированные точки секретов не пересекаются с alpha_1..alpha_n
+        self.beta = self.gf.elements[n + 1:n + 1 + ell]
+        # Интерполяционные узлы: ell секретов в beta + t случайных значений в alpha_1..alpha_t
+        nodes = np.concatenate((self.beta, self.rs.alpha[:self.t_shamir]))
+        self.share_matrix = self._lagrange_matrix(nodes, self.rs.alpha)
+
+    def random_secrets(self):
+        return self.gf.Random((self.n, self.ell))
+
+    def _lagrange_matrix(self, nodes, points):
+        """
+        Матрица M (len(points) x len(nodes)): значения в points полинома,
+        проходящего через (nodes, y), равны M @ y.
+        """
+        M = self.gf.Ones((len(points), len(nodes)))
+        for j in range(len(nodes)):
+            for l in range(len(nodes)):
+                if l != j:
+                    M[:, j] *= (points - nodes[l]) / (nodes[j] - nodes[l])
+        return M
+
+    def share_row(self, secret):
+        """Доли одного набора из ell секретов"""
+        values = np.concatenate((secret, self.gf.Random(self.t_shamir)))
+        return self.share_matrix @ values
+
+    def share(self, secrets):
+        """(a) Разделение всех n x ell секретов одним матричным произведением"""
+        values = np.concatenate((secrets, self.gf.Random((self.n, self.t_shamir))), axis=1)
+        return values @ self.share_matrix.T
+
+    def compute(self, shares_matrix):
+        """(b) Локальные вычисления: ell линейных комбинаций сразу"""
+        return self.weights @ shares_matrix
+
+    def reconstruct(self, corrupted_z):
+        """(d) Один декодированный полином даёт все ell сумм"""
+        recovered_poly = self.rs.decode_berlekamp_massey(corrupted_z)
+        if recovered_poly is None:
+            return None, []
+        recalculated_z = recovered_poly(self.rs.alpha)
+        cheaters = [i for i in range(self.n) if recalculated_z[i] != corrupted_z[i]]
+        return recovered_poly(self.beta), cheaters
+
+    def run(self):
+        print("\n" + "="*60)
+        print(f"ЗАДАНИЕ 2*: УПАКОВАННАЯ СХЕМА ШАМИРА (ell = {self.ell})")
+        print("="*60)
+
+        secrets = self.random_secrets()
+        target_S = self.weights @ secrets
+
+        shares_matrix = self.share(secrets)
+        z_vector = self.compute(shares_matrix)
+
+        print(f"--- Запуск MPC (Участников: {self.n}, Порог t: {self.t_shamir}, k: {self.k_code}) ---")
+        print(f"1. Истинные суммы секретов (S_1..S_{self.ell}): {target_S}")
+
+        errors_count = (self.n - self.k_code) // 2
+        corrupted_z, _ = self.rs.add_error(z_vector, errors_count)
+        print(f"2. Вектор с ошибками (атака {errors_count} чел.): {corrupted_z}")
+
+        calculated_S, cheaters = self.reconstruct(corrupted_z)
+        if calculated_S is None:
+            print("ОШИБКА: Не удалось восстановить результат.")
+            return
+        print(f"3. Восстановленные суммы: {calculated_S}")
+        print(">>> ИТОГ: УСПЕХ! Значения совпали." if np.array_equal(calculated_S, target_S) else ">>> ИТОГ: ПРОВАЛ!")
+        print(f"   Обнаруженные обманщики (индексы): {cheaters}")
+
+
+# --- ЧАСТЬ 4: Долгоживущая сессия MPC ---
+class MPC_Session:
+    """
+    Сессия поверх MPC_Simulation (или PackedMPC_Simulation): матрица долей
+    хранится между вычислениями. Новый вектор весов -- одно произведение
+    lambda @ shares, обновление секрета одного участника -- замена строки
+    (ранг-1 поправка к z), а декодер использует кэшированный план RSCodes.
+    """
+    def __init__(self, mpc, secrets=None):
+        self.mpc = mpc
+        # своя копия: refresh_secret не должен менять массив вызывающего
+        self.secrets = mpc.random_secrets() if secrets is None else np.array(secrets, copy=True, subok=True)
+        self.shares_matrix = mpc.share(self.secrets)
+        self.weights = None
+        self.z_vector = None
+
+    def evaluate(self, weights):
+        """Результаты участников для нового вектора весов"""
+        self.weights = weights
+        self.z_vector = weights @ self.shares_matrix
+        return self.z_vector
+
+    def refresh_secret(self, j, secret):
+        """Участник j заново разделяет новый секрет"""
+        new_row = self.mpc.share_row(secret)
+        delta = new_row - self.shares_matrix[j]
+        self.shares_matrix[j] = new_row
+        self.secrets[j] = secret
+        if self.z_vector is not None:
+            self.z_vector = self.z_vector + self.weights[j] * delta
+        return self.z_vector
+
+    def target(self):
+        """Истинные взвешенные суммы для текущего вектора весов"""
+        if self.weights is None:
+            raise ValueError("Вектор весов не задан: сначала вызовите evaluate(weights)")
+        return self.weights @ self.secrets
+
+    def reconstruct(self, corrupted_z):
+        return self.mpc.reconstruct(corrupted_z)
+
+
+def benchmark_packed(gf, n, ells=(1, 2, 4), rounds=50):
+    """
+    Пропускная способность (восстановленных сумм в секунду) обычной схемы
+    и упакованной при одинаковом числе исправляемых ошибок (n - k) // 2.
+    """
+    lambdas = gf.Random(n)
+    plain = MPC_Simulation(n, lambdas, gf)
+    errors_count = (n - plain.k_code) // 2
+
+    print("\n" + "="*60)
+    print(f"БЕНЧМАРК: n={n}, k={plain.k_code}, исправляется ошибок: {errors_count}")
+    print("="*60)
+    print(f"{'Режим':<22} | {'t':<3} | {'сумм/раунд':<10} | {'сумм/с':<10} | {'ошибок':<6}")
+    print("-" * 65)
+
+    modes = [("Обычный (x=0)", plain)]
+    modes += [(f"Упакованный ell={ell}", PackedMPC_Simulation(n, lambdas, gf, ell)) for ell in ells]
+
+    results = {}
+    for name, sim in modes:
+        sim.reconstruct(sim.compute(sim.share(sim.random_secrets())))  # прогрев JIT
+        failures = 0
+        start = time.perf_counter()
+        for _ in range(rounds):
+            secrets = sim.random_secrets()
+            z_vector = sim.compute(sim.share(secrets))
+            corrupted_z, _ = sim.rs.add_error(z_vector, errors_count)
+            calculated_S, _ = sim.reconstruct(corrupted_z)
+            if calculated_S is None or not np.array_equal(calculated_S, lambdas @ secrets):
+                failures += 1
+        elapsed = time.perf_counter() - start
+        results[name] = rounds * sim.ell / elapsed
+        print(f"{name:<22} | {sim.t_shamir:<3} | {sim.ell:<10} | {results[name]:<10.1f} | {failures:<6}")
+    return results
+
+def benchmark_session(gf, n, num_weights=50, ell=1):
+    """
+    Много векторов весов над одними и теми же секретами: полный перезапуск
+    протокола против MPC_Session (одно произведение на вектор весов).
+    """
+    mpc = MPC_Simulation(n, gf.Random(n), gf) if ell == 1 else PackedMPC_Simulation(n, gf.Random(n), gf, ell)
+    errors_count = (n - mpc.k_code) // 2
+    secrets = mpc.random_secrets()
+    weight_vectors = [gf.Random(n) for _ in range(num_weights)]
+    mpc.reconstruct(mpc.compute(mpc.share(secrets)))  # прогрев JIT
+
+    print("\n" + "="*60)
+    print(f"БЕНЧМАРК СЕССИИ: n={n}, ell={ell}, векторов весов: {num_weights}")
+    print("="*60)
+
+    start = time.perf_counter()
+    for weights in weight_vectors:
+        mpc.weights = weights
+        corrupted_z, _ = mpc.rs.add_error(mpc.compute(mpc.share(secrets)), errors_count)
+        mpc.reconstruct(corrupted_z)
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    session = MPC_Session(mpc, secrets)
+    failures = 0
+    for j, weights in enumerate(weight_vectors):
+        if j % 10 == 9:
+            session.refresh_secret(j % n, mpc.random_secrets()[0])
+        z_vector = session.evaluate(weights)
+        corrupted_z, _ = mpc.rs.add_error(z_vector, errors_count)
+        calculated_S, _ = session.reconstruct(corrupted_z)
+        if calculated_S is None or not np.array_equal(calculated_S, session.target()):
+            failures += 1
+    session_time = time.perf_counter() - start
+
+    print(f"Полный перезапуск: {full_time:.3f} с ({num_weights / full_time:.1f} векторов/с)")
+    print(f"Сессия:            {session_time:.3f} с ({num_weights / session_time:.1f} векторов/с), ошибок: {failures}")
+    return full_time, session_time
+
 # --- ЗАПУСК ---
 if __name__ == "__main__":
-    GF = galois.GF(2**6)
+    if "--fast-start" in sys.argv:
+        startup_mode()
+    GF = get_field(2**6)
     N, K = 15, 7
     rs = RSCodes(N, K, GF)
     
@@ -220,4 +464,11 @@ if __name__ == "__main__":
     # Задание 2
     lambdas = GF.Random(N)
     mpc = MPC_Simulation(N, lambdas, GF)
-    mpc.run()
\ No newline at end of file
+    mpc.run()
+
+    # Задание 2*: упакованная схема
+    PackedMPC_Simulation(N, lambdas, GF, ell=2).run()
+
+    if "--bench" in sys.argv:
+        benchmark_packed(GF, N)
+        benchmark_session(GF, N)
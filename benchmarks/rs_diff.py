@@ -0,0 +1,244 @@
+"""
+Дифференциальный бенчмарк двух реализаций RS + Берлекэмп-Мэсси + MPC:
+    Alexander/indiv2.py   -- списки Python над простым полем F_q;
+    Alexey/Indiv2/main.py -- galois (RSCodes, MPC_Simulation).
+
+Обе реализации получают одинаковые нагрузки (n, k, сообщение, вектор ошибок)
+над одним и тем же простым полем GF(q): проверяется, что кодовые слова и
+декодированные сообщения совпадают, и записываются распределения задержек
+кодирования/декодирования и пропускная способность.
+
+    python benchmarks/rs_diff.py                  # сравнение с базовой линией
+    python benchmarks/rs_diff.py --save-baseline  # сохранить базовую линию
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "Alexander"))
+sys.path.insert(0, os.path.join(ROOT, "Alexey", "Indiv2"))
+
+import indiv2 as list_rs                      # noqa: E402
+from main import RSCodes, MPC_Simulation      # noqa: E402
+from fields import get_field                  # noqa: E402
+from channel import Channel                   # noqa: E402
+
+BASELINE_VERSION = 1
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rs_diff_baseline.json")
+CONFIGS = [(10, 4), (15, 7), (20, 8), (30, 10)]
+
+
+def _stats(latencies):
+    latencies = np.asarray(latencies)
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+    return {
+        'p50_ms': p50 * 1e3,
+        'p90_ms': p90 * 1e3,
+        'p99_ms': p99 * 1e3,
+        'words_per_s': len(latencies) / latencies.sum(),
+    }
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run_config(GF, n, k, words, seed):
+    """Одна конфигурация (n, k): одинаковые сообщения и ошибки для обеих реализаций"""
+    q = GF.order
+    t = (n - k) // 2
+    rng = np.random.default_rng(seed)
+    messages = rng.integers(0, q, size=(words, k))
+    errors, support = Channel(n, order=q, seed=seed).fixed_weight(words, t)
+
+    rs = RSCodes(n, k, GF)
+    alphas = [int(a) for a in rs.alpha]
+    warm = rs.encode(GF(messages[0]))[0] + GF(errors[0])
+    rs.decode_berlekamp_massey(warm)  # прогрев JIT
+
+    latency = {impl: {'encode': [], 'decode': []} for impl in ('alexander', 'alexey')}
+    mismatches = {'codeword': 0, 'decoded': 0, 'wrong_message': 0}
+
+    for msg, e in zip(messages, errors):
+        msg_list = [int(m) for m in msg]
+
+        c_list, dt = _timed(list_rs.rs_encode, msg_list, alphas, q)
+        latency['alexander']['encode'].append(dt)
+        (c_gf, _), dt = _timed(rs.encode, GF(msg))
+        latency['alexey']['encode'].append(dt)
+        if c_list != [int(c) for c in c_gf]:
+            mismatches['codeword'] += 1
+
+        received = [(c + int(v)) % q for c, v in zip(c_list, e)]
+
+        (dec_list, _), dt = _timed(list_rs.rs_decode_bm_correct, received, alphas, n, k, q)
+        latency['alexander']['decode'].append(dt)
+        poly, dt = _timed(rs.decode_berlekamp_massey, GF(received))
+        latency['alexey']['decode'].append(dt)
+
+        dec_list = (dec_list + [0] * k)[:k]
+        dec_gf = [0] * k
+        if poly is not None:
+            coeffs = [int(c) for c in poly.coeffs[::-1]]
+            dec_gf = (coeffs + [0] * k)[:k]
+        if dec_list != dec_gf:
+            mismatches['decoded'] += 1
+        if dec_list != msg_list or dec_gf != msg_list:
+            mismatches['wrong_message'] += 1
+
+    return {
+        'n': n, 'k': k, 't': t, 'words': words,
+        'mismatches': mismatches,
+        'alexander': {op: _stats(v) for op, v in latency['alexander'].items()},
+        'alexey': {op: _stats(v) for op, v in latency['alexey'].items()},
+    }
+
+
+def run_mpc(GF, n, rounds, seed):
+    """
+    MPC: одинаковые секреты и веса; сумма считается обеими реализациями
+    (раздача долей, локальные вычисления, атака t участников, декодирование).
+    """
+    q = GF.order
+    rng = np.random.default_rng(seed)
+    mpc = MPC_Simulation(n, GF(rng.integers(1, q, size=n)), GF)
+    k, t = mpc.k_code, (n - mpc.k_code) // 2
+    alphas = [int(a) for a in mpc.rs.alpha]
+    weights = [int(w) for w in mpc.weights]
+    latency = {'alexander': [], 'alexey': []}
+    mismatches = 0
+
+    for _ in range(rounds):
+        secrets = rng.integers(0, q, size=n)
+        randomness = rng.integers(0, q, size=(n, k - 1))
+        attacked = rng.permutation(n)[:t]
+        shift = rng.integers(1, q, size=t)
+
+        start = time.perf_counter()
+        shares = [list_rs.rs_encode([int(s)] + [int(r) for r in row], alphas, q)
+                  for s, row in zip(secrets, randomness)]
+        z = [sum(w * shares[i][j] for i, w in enumerate(weights)) % q for j in range(n)]
+        for idx, d in zip(attacked, shift):
+            z[idx] = (z[idx] + int(d)) % q
+        decoded, _ = list_rs.rs_decode_bm_correct(z, alphas, n, k, q)
+        latency['alexander'].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        coeffs = GF(np.concatenate((secrets[:, None], randomness), axis=1))
+        shares_gf = GF.Zeros((n, n))
+        for j in range(n):
+            shares_gf[j] = mpc.rs.encode(coeffs[j])[0]
+        z_gf = mpc.compute(shares_gf)
+        z_gf[attacked] += GF(shift)
+        S, _ = mpc.reconstruct(z_gf)
+        latency['alexey'].append(time.perf_counter() - start)
+
+        if S is None or decoded[0] != int(S):
+            mismatches += 1
+
+    return {
+        'n': n, 'k': k, 't': t, 'rounds': rounds, 'mismatches': mismatches,
+        'alexander': _stats(latency['alexander']),
+        'alexey': _stats(latency['alexey']),
+    }
+
+
+def run_suite(q=61, words=200, rounds=50, seed=2024):
+    GF = get_field(q)
+    results = {}
+    for n, k in CONFIGS:
+        results[f"rs n={n} k={k}"] = run_config(GF, n, k, words, seed)
+    results[f"mpc n={CONFIGS[1][0]}"] = run_mpc(GF, CONFIGS[1][0], rounds, seed)
+    return {'version': BASELINE_VERSION, 'q': q, 'words': words, 'rounds': rounds, 'results': results}
+
+
+def _rows(report):
+    """Плоский список (ключ, реализация, операция, stats) для печати и сравнения"""
+    for key, res in report['results'].items():
+        for impl in ('alexander', 'alexey'):
+            if 'p50_ms' in res[impl]:
+                yield key, impl, 'round', res[impl]
+            else:
+                for op, stats in res[impl].items():
+                    yield key, impl, op, stats
+
+
+def print_report(report):
+    print("=" * 88)
+    print(f"ДИФФЕРЕНЦИАЛЬНЫЙ БЕНЧМАРК RS/MPC над GF({report['q']})")
+    print("=" * 88)
+    print(f"{'Нагрузка':<18} | {'Реализация':<10} | {'Операция':<8} | {'p50, мс':<8} | "
+          f"{'p90, мс':<8} | {'p99, мс':<8} | {'слов/с':<10}")
+    print("-" * 88)
+    for key, impl, op, s in _rows(report):
+        print(f"{key:<18} | {impl:<10} | {op:<8} | {s['p50_ms']:<8.3f} | "
+              f"{s['p90_ms']:<8.3f} | {s['p99_ms']:<8.3f} | {s['words_per_s']:<10.1f}")
+    print("-" * 88)
+    for key, res in report['results'].items():
+        print(f"{key:<18} расхождения: {res['mismatches']}")
+
+
+def compare_with_baseline(report, baseline, tolerance):
+    """Регрессия -- медианная задержка выросла больше чем на tolerance"""
+    base = {(key, impl, op): s for key, impl, op, s in _rows(baseline)}
+    regressions = []
+    for key, impl, op, s in _rows(report):
+        old = base.get((key, impl, op))
+        if old and s['p50_ms'] > old['p50_ms'] * (1 + tolerance):
+            regressions.append((key, impl, op, old['p50_ms'], s['p50_ms']))
+    return regressions
+
+
+def _has_mismatches(report):
+    for res in report['results'].values():
+        m = res['mismatches']
+        if (sum(m.values()) if isinstance(m, dict) else m) > 0:
+            return True
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--q", type=int, default=61, help="простое q (поле GF(q) для обеих реализаций)")
+    parser.add_argument("--words", type=int, default=200, help="слов на конфигурацию RS")
+    parser.add_argument("--rounds", type=int, default=50, help="раундов MPC")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="допустимый рост медианы (доля)")
+    args = parser.parse_args()
+
+    report = run_suite(args.q, args.words, args.rounds, args.seed)
+    print_report(report)
+    status = 1 if _has_mismatches(report) else 0
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nБазовая линия сохранена: {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get('version') != BASELINE_VERSION or baseline.get('q') != report['q']:
+            print("\nБазовая линия несовместима (другая версия формата или поле), сравнение пропущено.")
+        else:
+            regressions = compare_with_baseline(report, baseline, args.tolerance)
+            print(f"\nРегрессий (рост p50 > {args.tolerance:.0%}): {len(regressions)}")
+            for key, impl, op, old, new in regressions:
+                print(f"  {key} / {impl} / {op}: {old:.3f} мс -> {new:.3f} мс")
+            if regressions:
+                status = 1
+    else:
+        print(f"\nБазовая линия не найдена ({args.baseline}), запустите с --save-baseline.")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())